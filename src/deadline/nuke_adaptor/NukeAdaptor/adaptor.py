@@ -2,15 +2,18 @@
 
 from __future__ import annotations
 
+import importlib.util
 import logging
 import os
 import re
-import sys
 import threading
 import time
 import jsonschema  # type: ignore
 from typing import Callable, cast
 
+import deadline.nuke_adaptor
+import deadline.nuke_util
+import openjd.adaptor_runtime_client
 from deadline.client.api import get_deadline_cloud_library_telemetry_client, TelemetryClient
 from openjd.adaptor_runtime._version import version as openjd_adaptor_version
 from openjd.adaptor_runtime.adaptors import Adaptor, AdaptorDataValidators, SemanticVersion
@@ -23,6 +26,21 @@ from .._version import version as adaptor_version
 
 _logger = logging.getLogger(__name__)
 
+_SCHEMA_DIR = os.path.join(os.path.dirname(__file__), "schemas")
+
+# The Open Job Description and deadline namespace directories, so that adaptor_runtime_client,
+# nuke_adaptor and nuke_util will be available directly to the nuke client.
+_PYTHONPATH_DIRS = tuple(
+    dict.fromkeys(
+        os.path.dirname(os.path.dirname(module_file))
+        for module_file in (
+            openjd.adaptor_runtime_client.__file__,
+            deadline.nuke_adaptor.__file__,
+            deadline.nuke_util.__file__,
+        )
+    )
+)
+
 
 class NukeNotRunningError(Exception):
     """Error that is raised when attempting to use Nuke while it is not running"""
@@ -31,13 +49,42 @@ class NukeNotRunningError(Exception):
 
 
 # Actions which must be queued before any others
-_FIRST_NUKE_ACTIONS = ["script_file"]
-_NUKE_INIT_KEYS = {
+_FIRST_NUKE_ACTIONS = ("script_file",)
+# Optional init data keys, queued in this order when present
+_NUKE_INIT_KEYS = (
     "continue_on_error",
     "proxy",
     "write_nodes",
     "views",
+)
+# Sentinel for init data keys that are not present
+_MISSING = object()
+
+# Patterns matched against each line of Nuke's stdout/stderr. These are compiled once per process
+# and shared by every adaptor instance.
+_COMPLETED_REGEX = re.compile(r"NukeClient: Finished Rendering Frames? \d+(?:-\d+)?")
+_PROGRESS_REGEX = re.compile(r"NukeClient: Creating outputs (\d+)-(\d+) of (\d+) total outputs\.")
+_OUTPUT_COMPLETE_REGEX = re.compile(r"Writing .+ took [\d.]+ seconds")
+# No surrounding ".*" is needed since lines are matched with search; the handler reports the whole
+# line.
+_ERROR_REGEX = re.compile(r"ERROR:|Error ?:|Eddy\[ERROR\]")
+# A plain literal; the version itself (ie. 15.0v1) is read from the rest of the line.
+_VERSION_REGEX = re.compile(r"NukeClient: Nuke Version ")
+
+# The NukeAdaptor method that handles each status pattern. If several patterns match at the same
+# position of a line, the first one listed wins. Errors are deliberately not included: they are
+# matched by their own callback so an error later in a line is never shadowed by a status message.
+_STDOUT_HANDLERS: dict[str, re.Pattern] = {
+    "_handle_complete": _COMPLETED_REGEX,
+    "_handle_progress": _PROGRESS_REGEX,
+    "_handle_output_complete": _OUTPUT_COMPLETE_REGEX,
+    "_handle_version": _VERSION_REGEX,
 }
+# The status patterns above combined into a single alternation with one named group per handler,
+# so each line is scanned once for them rather than once per pattern.
+_STDOUT_REGEX = re.compile(
+    "|".join(f"(?P<{name}>{regex.pattern})" for name, regex in _STDOUT_HANDLERS.items())
+)
 
 
 def _check_for_exception(func: Callable) -> Callable:
@@ -53,6 +100,24 @@ def _check_for_exception(func: Callable) -> Callable:
     return wrapped_func
 
 
+class _NotifyingActionsQueue(ActionsQueue):
+    """
+    ActionsQueue that notifies a condition when the Nuke client takes the last action, so the
+    adaptor can wait for the queue to drain without polling it.
+    """
+
+    def __init__(self, cond: threading.Condition) -> None:
+        super().__init__()
+        self._cond = cond
+
+    def dequeue_action(self) -> Action | None:
+        with self._cond:
+            action = super().dequeue_action()
+            if action is not None and not self:
+                self._cond.notify_all()
+        return action
+
+
 class NukeAdaptor(Adaptor):
     """
     Adaptor that creates a session in Nuke to Render interactively.
@@ -62,23 +127,41 @@ class NukeAdaptor(Adaptor):
     _SERVER_END_TIMEOUT_SECONDS = 30
     _NUKE_START_TIMEOUT_SECONDS = 300
     _NUKE_END_TIMEOUT_SECONDS = 30
-
-    _server: AdaptorServer | None = None
-    _server_thread: threading.Thread | None = None
-    _nuke_client: LoggingSubprocess | None = None
-    _action_queue = ActionsQueue()
-    _is_rendering: bool = False
-    # If a thread raises an exception we will update this to raise in the main thread
-    _exc_info: Exception | None = None
-    _performing_cleanup = False
-    _regex_callbacks: list | None = None
-    _validators: AdaptorDataValidators | None = None
-    _telemetry_client: TelemetryClient | None = None
-
-    # Output tracking for progress handling
-    _curr_output: int = 1
-    _total_outputs: int = 1
-    _nuke_version: str = ""
+    # Upper bound on how long a waiting thread sleeps before re-checking state that nothing notifies
+    # about, which is only the Nuke process exiting.
+    _STATE_POLL_INTERVAL_SECONDS = 0.1
+    # Minimum time between progress updates that do not cross a whole percent
+    _STATUS_UPDATE_INTERVAL_SECONDS = 0.1
+
+    def __init__(self, init_data: dict, **kwargs) -> None:
+        super().__init__(init_data, **kwargs)
+        self._server: AdaptorServer | None = None
+        self._server_thread: threading.Thread | None = None
+        # Set by the server thread once the adaptor server has been created and has a socket path
+        self._server_ready = threading.Event()
+        self._nuke_client: LoggingSubprocess | None = None
+        # Notified whenever rendering, error or queue state changes so waiting threads wake
+        # immediately
+        self._state_cond = threading.Condition()
+        self._action_queue = _NotifyingActionsQueue(self._state_cond)
+        self._is_rendering = False
+        # If a thread raises an exception we will update this to raise in the main thread
+        self._exc_info: Exception | None = None
+        self._performing_cleanup = False
+        self._regex_callbacks: list | None = None
+        self._validators: AdaptorDataValidators | None = None
+        self._telemetry_client: TelemetryClient | None = None
+        self._nuke_client_path: str | None = None
+
+        # Output tracking for progress handling
+        self._curr_output = 1
+        self._total_outputs = 1
+        # 100.0 / _total_outputs, kept in sync so the progress property only has to multiply
+        self._progress_scale = 100.0
+        # The progress most recently sent with update_status, so unchanged progress is not resent
+        self._last_reported_progress = -1.0
+        self._last_status_update_time = float("-inf")
+        self._nuke_version = ""
 
     @property
     def integration_data_interface_version(self) -> SemanticVersion:
@@ -87,8 +170,9 @@ class NukeAdaptor(Adaptor):
     @staticmethod
     def _get_timer(timeout: int | float) -> Callable[[], bool]:
         """Given a timeout length, returns a lambda which returns False until the timeout occurs"""
-        timeout_time = time.time() + timeout
-        return lambda: time.time() >= timeout_time
+        monotonic = time.monotonic
+        timeout_time = monotonic() + timeout
+        return lambda: monotonic() >= timeout_time
 
     @property
     def _has_exception(self) -> bool:
@@ -113,6 +197,15 @@ class NukeAdaptor(Adaptor):
         """
         return cast(bool, self.init_data.get("continue_on_error", True))
 
+    @property
+    def telemetry_opt_out(self) -> bool:
+        """Property which returns whether telemetry should not be recorded
+
+        Returns:
+            bool: True if telemetry has been opted out of. False otherwise.
+        """
+        return cast(bool, self.init_data.get("telemetry_opt_out", False))
+
     @property
     def _nuke_is_running(self) -> bool:
         """Property which indicates that the nuke client is running
@@ -131,54 +224,43 @@ class NukeAdaptor(Adaptor):
         Returns:
             float: The calculated progress
         """
-        return max(min(round(100.0 * self._curr_output / self._total_outputs, 2), 100), 0)
+        return max(min(round(self._curr_output * self._progress_scale, 2), 100), 0)
 
     @property
     def validators(self) -> AdaptorDataValidators:
         if not self._validators:
-            cur_dir = os.path.dirname(__file__)
-            schema_dir = os.path.join(cur_dir, "schemas")
-            self._validators = AdaptorDataValidators.for_adaptor(schema_dir)
+            self._validators = AdaptorDataValidators.for_adaptor(_SCHEMA_DIR)
         return self._validators
 
     @property
     def regex_callbacks(self) -> list[RegexCallback]:
         """
-        Returns a list of RegexCallbacks used by the Nuke Adaptor
+        Returns a list of RegexCallbacks used by the Nuke Adaptor. One callback matches the
+        combined status regex and dispatches to the handler for whichever pattern matched; errors
+        have their own callback so they are detected regardless of what else is on the line.
 
         Returns:
             list[RegexCallback]: List of Regex Callbacks to add
         """
         if not self._regex_callbacks:
-            callback_list = []
-            completed_regexes = [
-                re.compile("NukeClient: Finished Rendering Frame [0-9]+"),
-                re.compile("NukeClient: Finished Rendering Frames [0-9]+-[0-9]+"),
+            self._regex_callbacks = [
+                RegexCallback([_STDOUT_REGEX], self._handle_stdout),
+                RegexCallback([_ERROR_REGEX], self._handle_error),
             ]
-            progress_regexes = [
-                re.compile(
-                    "NukeClient: Creating outputs ([0-9]+)-([0-9]+) of ([0-9]+) total outputs."
-                ),
-            ]
-            error_regexes = [
-                re.compile(".*ERROR:.*"),
-                re.compile(".*Error:.*"),
-                re.compile(".*Error :.*"),
-                re.compile(".*Eddy\\[ERROR\\].*"),
-            ]
-            # Capture the major minor group (ie. 15.0), patch version (ie. v1) is an optional subgroup.
-            version_regexes = [re.compile("NukeClient: Nuke Version ([0-9]+.[0-9]+)(v[0-9]+)?")]
-            output_complete_regexes = [re.compile(r"Writing .+ took [0-9\.]+ seconds")]
-            callback_list.append(RegexCallback(completed_regexes, self._handle_complete))
-            callback_list.append(RegexCallback(progress_regexes, self._handle_progress))
-            callback_list.append(
-                RegexCallback(output_complete_regexes, self._handle_output_complete)
-            )
-            callback_list.append(RegexCallback(error_regexes, self._handle_error))
-            callback_list.append(RegexCallback(version_regexes, self._handle_version))
-            self._regex_callbacks = callback_list
         return self._regex_callbacks
 
+    def _handle_stdout(self, match: re.Match) -> None:
+        """
+        Callback for any line matched by the combined stdout regex. Re-matches the pattern that
+        matched so its handler receives a match object with that pattern's own groups.
+
+        Args:
+            match (re.Match): The match object from the combined regex pattern
+        """
+        name = cast(str, match.lastgroup)
+        handler_match = cast(re.Match, _STDOUT_HANDLERS[name].match(match.string, match.start()))
+        getattr(self, name)(handler_match)
+
     @_check_for_exception
     def _handle_complete(self, match: re.Match) -> None:
         """
@@ -186,9 +268,33 @@ class NukeAdaptor(Adaptor):
         Args:
             match (re.Match): The match object from the regex pattern that was matched the message
         """
-        self._is_rendering = False
+        with self._state_cond:
+            self._is_rendering = False
+            self._state_cond.notify_all()
+        self._last_reported_progress = 100
+        self._last_status_update_time = time.monotonic()
         self.update_status(progress=100, status_message="RENDER COMPLETE")
 
+    def _report_progress(self, progress: float) -> None:
+        """
+        Sends progress with update_status, coalescing bursts of small changes. An update is sent
+        when progress crosses a whole percent, reaches 100, or the update interval has elapsed
+        since the last one.
+        Args:
+            progress (float): The current progress of the render
+        """
+        if progress == self._last_reported_progress:
+            return
+        now = time.monotonic()
+        if (
+            progress >= 100
+            or int(progress) != int(self._last_reported_progress)
+            or now - self._last_status_update_time >= self._STATUS_UPDATE_INTERVAL_SECONDS
+        ):
+            self._last_reported_progress = progress
+            self._last_status_update_time = now
+            self.update_status(progress=progress)
+
     @_check_for_exception
     def _handle_progress(self, match: re.Match) -> None:
         """
@@ -196,9 +302,10 @@ class NukeAdaptor(Adaptor):
         Args:
             match (re.Match): The match object from the regex pattern that was matched the message
         """
-        self._curr_output = int(match.groups()[0])
-        self._total_outputs = int(match.groups()[2])
-        self.update_status(progress=self.progress)
+        self._curr_output = int(match.group(1))
+        self._total_outputs = int(match.group(3))
+        self._progress_scale = 100.0 / self._total_outputs
+        self._report_progress(self.progress)
 
     @_check_for_exception
     def _handle_output_complete(self, match: re.Match) -> None:
@@ -209,7 +316,7 @@ class NukeAdaptor(Adaptor):
         """
         self._curr_output += 1
         if self._is_rendering:
-            self.update_status(progress=self.progress)
+            self._report_progress(self.progress)
 
     def _handle_error(self, match: re.Match) -> None:
         """
@@ -220,7 +327,9 @@ class NukeAdaptor(Adaptor):
             match (re.Match): The match object from the regex pattern that was matched the message
         """
         if not self.continue_on_error:
-            self._exc_info = RuntimeError(f"Nuke Encountered an Error: {match.group(0)}")
+            with self._state_cond:
+                self._exc_info = RuntimeError(f"Nuke Encountered an Error: {match.string}")
+                self._state_cond.notify_all()
 
     def _handle_version(self, match: re.Match) -> None:
         """
@@ -228,15 +337,15 @@ class NukeAdaptor(Adaptor):
         Args:
             match (re.Match): The match object from the regex pattern that was matched the message
         """
-        self._nuke_version = match.groups()[0]
-        if len(match.groups()) > 1 and match.groups()[1]:
-            self._nuke_version += match.groups()[1]
+        version = match.string[match.end() :].split(maxsplit=1)
+        if version:
+            self._nuke_version = version[0]
 
     @property
     def server_server_path(self) -> str:
         """
-        Performs a busy wait for the socket path that the adaptor server is running on, then returns
-        it.
+        Waits for the server thread to signal that the adaptor server has started, then returns the
+        socket path that the server is running on.
 
         Raises:
             RuntimeError: If the server does not finish initializing
@@ -244,9 +353,7 @@ class NukeAdaptor(Adaptor):
         Returns:
             str: The socket path the adaptor server is running on.
         """
-        is_timed_out = self._get_timer(self._SERVER_START_TIMEOUT_SECONDS)
-        while (self._server is None or self._server.server_path is None) and not is_timed_out():
-            time.sleep(0.01)
+        self._server_ready.wait(timeout=self._SERVER_START_TIMEOUT_SECONDS)
 
         if self._server is not None and self._server.server_path is not None:
             return self._server.server_path
@@ -256,7 +363,8 @@ class NukeAdaptor(Adaptor):
     @property
     def nuke_client_path(self) -> str:
         """
-        Obtains the nuke_client.py path by searching directories in sys.path
+        Obtains the nuke_client.py path by looking up the NukeClient package through the import
+        system. The result of the first successful lookup is cached.
 
         Raises:
             FileNotFoundError: If the nuke_client.py file could not be found.
@@ -264,13 +372,20 @@ class NukeAdaptor(Adaptor):
         Returns:
             str: The path to the nuke_client.py file.
         """
-        for dir_ in sys.path:
-            path = os.path.join(dir_, "deadline", "nuke_adaptor", "NukeClient", "nuke_client.py")
+        if self._nuke_client_path:
+            return self._nuke_client_path
+
+        # find_spec locates the package without importing it, which would require the nuke module
+        spec = importlib.util.find_spec("deadline.nuke_adaptor.NukeClient")
+        search_locations = (spec.submodule_search_locations or []) if spec else []
+        for dir_ in search_locations:
+            path = os.path.join(dir_, "nuke_client.py")
             if os.path.isfile(path):
+                self._nuke_client_path = path
                 return path
         raise FileNotFoundError(
-            "Could not find nuke_client.py. Check that the NukeClient package is in one of the "
-            f"following directories: {sys.path[1:]}"
+            "Could not find nuke_client.py. Check that the NukeClient package is installed in one "
+            f"of the following directories: {list(search_locations)}"
         )
 
     def on_start(self) -> None:
@@ -295,28 +410,30 @@ class NukeAdaptor(Adaptor):
         self._start_nuke_client()
 
         is_timed_out = self._get_timer(self._NUKE_START_TIMEOUT_SECONDS)
-        while self._nuke_is_running and not self._has_exception and len(self._action_queue) > 0:
-            if is_timed_out():
-                raise TimeoutError(
-                    "Nuke did not complete initialization actions in "
-                    f"{self._NUKE_START_TIMEOUT_SECONDS} seconds and failed to start."
-                )
-
-            time.sleep(0.1)  # busy wait for nuke to finish initialization
-
-        self._get_deadline_telemetry_client().record_event(
-            event_type="com.amazon.rum.deadline.adaptor.runtime.start", event_details={}
-        )
+        with self._state_cond:
+            while self._nuke_is_running and not self._has_exception and self._action_queue:
+                if is_timed_out():
+                    raise TimeoutError(
+                        "Nuke did not complete initialization actions in "
+                        f"{self._NUKE_START_TIMEOUT_SECONDS} seconds and failed to start."
+                    )
+
+                # wait for nuke to finish initialization
+                self._state_cond.wait(self._STATE_POLL_INTERVAL_SECONDS)
+
+        if not self.telemetry_opt_out:
+            self._get_deadline_telemetry_client().record_event(
+                event_type="com.amazon.rum.deadline.adaptor.runtime.start", event_details={}
+            )
 
-        if len(self._action_queue) > 0:
+        if self._action_queue:
             raise RuntimeError(
                 "Nuke encountered an error and was not able to complete initialization actions."
             )
 
     def on_run(self, run_data: dict) -> None:
         """
-        This starts a render in Nuke for the given frame and performs a busy wait until the render
-        completes.
+        This starts a render in Nuke for the given frame and waits until the render completes.
         """
         if not self._nuke_is_running:
             raise NukeNotRunningError("Cannot render because Nuke is not running.")
@@ -336,17 +453,20 @@ class NukeAdaptor(Adaptor):
             )
         )
 
-        while self._nuke_is_running and self._is_rendering and not self._has_exception:
-            time.sleep(0.1)  # busy wait so that on_cleanup is not called
+        with self._state_cond:
+            while self._nuke_is_running and self._is_rendering and not self._has_exception:
+                # wait so that on_cleanup is not called
+                self._state_cond.wait(self._STATE_POLL_INTERVAL_SECONDS)
 
         if not self._nuke_is_running and self._nuke_client:  # Nuke Client will always exist here.
             #  This is always an error case because the Nuke Client should still be running and
             #  waiting for the next command. If the thread finished, then we cannot continue
             exit_code = self._nuke_client.returncode
 
-            self._get_deadline_telemetry_client().record_error(
-                {"exit_code": exit_code, "exception_scope": "on_run"}, str(RuntimeError)
-            )
+            if not self.telemetry_opt_out:
+                self._get_deadline_telemetry_client().record_error(
+                    {"exit_code": exit_code, "exception_scope": "on_run"}, str(RuntimeError)
+                )
             raise RuntimeError(
                 "Nuke exited early and did not render successfully, please check render logs. "
                 f"Exit code {exit_code}"
@@ -366,8 +486,9 @@ class NukeAdaptor(Adaptor):
 
         self._action_queue.enqueue_action(Action("close"), front=True)
         is_timed_out = self._get_timer(self._NUKE_END_TIMEOUT_SECONDS)
-        while self._nuke_is_running and not is_timed_out():
-            time.sleep(0.1)
+        with self._state_cond:
+            while self._nuke_is_running and not is_timed_out():
+                self._state_cond.wait(self._STATE_POLL_INTERVAL_SECONDS)
         if self._nuke_is_running and self._nuke_client:
             _logger.error(
                 "Nuke did not complete cleanup actions and failed to gracefully shutdown. "
@@ -413,6 +534,7 @@ class NukeAdaptor(Adaptor):
             serves forever in a blocking call.
             """
             self._server = AdaptorServer(self._action_queue, self)
+            self._server_ready.set()
             self._server.serve_forever()
 
         server_thread = threading.Thread(target=start_nuke_server)
@@ -435,26 +557,13 @@ class NukeAdaptor(Adaptor):
         nuke_exe = os.environ.get("NUKE_ADAPTOR_NUKE_EXECUTABLE", "nuke")
         regexhandler = RegexHandler(self.regex_callbacks)
 
-        # Add the Open Job Description namespace directory to PYTHONPATH, so that adaptor_runtime_client
-        # will be available directly to the nuke client.
-        import openjd.adaptor_runtime_client
-        import deadline.nuke_adaptor
-        import deadline.nuke_util
-
-        openjd_namespace_dir = os.path.dirname(
-            os.path.dirname(openjd.adaptor_runtime_client.__file__)
-        )
-        deadline_adaptor_namespace_dir = os.path.dirname(
-            os.path.dirname(deadline.nuke_adaptor.__file__)
-        )
-        deadline_util_namespace_dir = os.path.dirname(os.path.dirname(deadline.nuke_util.__file__))
-        python_path_addition = f"{openjd_namespace_dir}{os.pathsep}{deadline_adaptor_namespace_dir}{os.pathsep}{deadline_util_namespace_dir}"
-        if "PYTHONPATH" in os.environ:
-            os.environ["PYTHONPATH"] = (
-                f"{os.environ['PYTHONPATH']}{os.pathsep}{python_path_addition}"
-            )
-        else:
-            os.environ["PYTHONPATH"] = python_path_addition
+        # Add the Open Job Description and deadline namespace directories to PYTHONPATH, unless a
+        # previous start of the client already added them
+        python_path = os.environ.get("PYTHONPATH")
+        python_path_dirs = python_path.split(os.pathsep) if python_path else []
+        missing_dirs = [dir_ for dir_ in _PYTHONPATH_DIRS if dir_ not in python_path_dirs]
+        if missing_dirs:
+            os.environ["PYTHONPATH"] = os.pathsep.join(python_path_dirs + missing_dirs)
 
         self._nuke_client = LoggingSubprocess(
             args=[nuke_exe, "-V", "2", "-t", self.nuke_client_path],
@@ -465,15 +574,17 @@ class NukeAdaptor(Adaptor):
     def _populate_action_queue(self) -> None:
         """
         Populates the adaptor server's action queue with actions from the init_data that the Nuke
-        Client will request and perform. The action must be present in the _FIRST_NUKE_ACTIONS or
-        _NUKE_INIT_KEYS set to be added to the action queue.
+        Client will request and perform. The action must be present in _FIRST_NUKE_ACTIONS or
+        _NUKE_INIT_KEYS to be added to the action queue.
         """
+        init_data = self.init_data
         for name in _FIRST_NUKE_ACTIONS:
-            self._action_queue.enqueue_action(Action(name, {name: self.init_data[name]}))
+            self._action_queue.enqueue_action(Action(name, {name: init_data[name]}))
 
         for name in _NUKE_INIT_KEYS:
-            if name in self.init_data:
-                self._action_queue.enqueue_action(Action(name, {name: self.init_data[name]}))
+            value = init_data.get(name, _MISSING)
+            if value is not _MISSING:
+                self._action_queue.enqueue_action(Action(name, {name: value}))
 
     def _get_deadline_telemetry_client(self):
         """
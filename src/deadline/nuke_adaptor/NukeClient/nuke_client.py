@@ -3,11 +3,11 @@
 from __future__ import annotations
 
 import os
-from functools import lru_cache
 from pathlib import Path, PurePath
 from types import FrameType as FrameType
 from typing import (
     List,
+    NamedTuple,
     Optional,
 )
 
@@ -37,6 +37,42 @@ except ImportError:
     from deadline.nuke_util import ocio as nuke_ocio
 
 
+def _normalize_path(path: str) -> str:
+    """Normalizes a path so that equal paths compare equal as strings"""
+    return os.path.normcase(os.path.normpath(path))
+
+
+def _path_prefix(normalized_path: str) -> str:
+    """Returns the string that every normalized path below the given one starts with"""
+    return normalized_path if normalized_path.endswith(os.sep) else normalized_path + os.sep
+
+
+class _IndexedPathMappingRule(NamedTuple):
+    """A path mapping rule with its source and destination paths analysed once up front"""
+
+    rule: PathMappingRule
+    source_is_absolute: bool
+    normalized_source_path: str
+    source_prefix: str
+    destination_is_absolute: bool
+    normalized_destination_path: str
+    destination_prefix: str
+
+    @classmethod
+    def from_rule(cls, rule: PathMappingRule) -> _IndexedPathMappingRule:
+        normalized_source_path = _normalize_path(rule.source_path)
+        normalized_destination_path = _normalize_path(rule.destination_path)
+        return cls(
+            rule,
+            PurePath(rule.source_path).is_absolute(),
+            normalized_source_path,
+            _path_prefix(normalized_source_path),
+            PurePath(rule.destination_path).is_absolute(),
+            normalized_destination_path,
+            _path_prefix(normalized_destination_path),
+        )
+
+
 class NukeClient(_ClientInterface):
     """
     Client for that runs in Nuke for the Nuke Adaptor
@@ -44,6 +80,12 @@ class NukeClient(_ClientInterface):
 
     def __init__(self, server_path: str) -> None:
         super().__init__(server_path=server_path)
+        # Nuke calls the filename filter for every filename it resolves, so mapped paths and the
+        # path mapping rules are remembered for the lifetime of the client.
+        self._map_path_cache: dict[str, str] = {}
+        self._path_mapping_rules_cache: List[_IndexedPathMappingRule] | None = None
+        # Output directories already created or found, so later frames can skip the filesystem
+        self._ensured_output_dirs: set[str] = set()
         self.actions.update(NukeHandler().action_dict)
         print(f"NukeClient: Nuke Version {nuke.env['NukeVersionString']}", flush=True)
 
@@ -54,8 +96,9 @@ class NukeClient(_ClientInterface):
                 output_filename = os.path.join(os.getcwd(), output_filename)
             output_dir = os.path.dirname(output_filename)
             # Filenames can contain folders, if they do and the folders do not exist, create them
-            if output_dir and not os.path.isdir(output_dir):
-                os.makedirs(output_dir)
+            if output_dir and output_dir not in self._ensured_output_dirs:
+                os.makedirs(output_dir, exist_ok=True)
+                self._ensured_output_dirs.add(output_dir)
 
         def verify_ocio_config():
             """If using an OCIO config, update the internal search paths if necessary"""
@@ -74,23 +117,44 @@ class NukeClient(_ClientInterface):
         nuke.scriptClose()
         nuke.scriptExit()
 
-    @lru_cache(maxsize=None)
     def map_path(self, path: str) -> str:
         """
         Override of the base map_path implementation to return the mapped path without back slashes.
         We must do this because Write nodes in nuke will error if paths contain back slashes.
         """
-        rules = self.path_mapping_rules()
+        mapped_path = self._map_path_cache.get(path)
+        if mapped_path is None:
+            mapped_path = self._map_path(path)
+            self._map_path_cache[path] = mapped_path
+        return mapped_path
+
+    def _map_path(self, path: str) -> str:
+        """Maps a path that is not in the cache yet"""
+        if self._path_mapping_rules_cache is None:
+            self._path_mapping_rules_cache = [
+                _IndexedPathMappingRule.from_rule(rule)
+                for rule in self.path_mapping_rules()
+                if rule
+            ]
+        if not self._path_mapping_rules_cache:
+            # Nothing can map, so skip asking the adaptor to map the path
+            return Path(path).as_posix()
 
-        rule = self._which_rule_applies(path, rules)
+        path_is_absolute = PurePath(path).is_absolute()
+        normalized_path = _normalize_path(path)
+        indexed_rule = self._which_rule_applies(
+            normalized_path, path_is_absolute, self._path_mapping_rules_cache
+        )
         # on finding rule match, if the DESTINATION PATH is a parent of the given PATH return original PATH
         # this prevents the situation where path <a>/<b> is attempting to map to itself i.e. map to <a>/<a>/<b>
 
         if (
-            rule
-            and PurePath(path).is_absolute() == PurePath(rule.destination_path).is_absolute()
-            and PurePath(os.path.commonpath((path, rule.destination_path)))
-            == PurePath(rule.destination_path)
+            indexed_rule
+            and path_is_absolute == indexed_rule.destination_is_absolute
+            and (
+                normalized_path == indexed_rule.normalized_destination_path
+                or normalized_path.startswith(indexed_rule.destination_prefix)
+            )
         ):
             return Path(path).as_posix()
 
@@ -98,21 +162,19 @@ class NukeClient(_ClientInterface):
         return Path(result).as_posix()
 
     def _which_rule_applies(
-        self, path: str, rules: List[PathMappingRule]
-    ) -> PathMappingRule | None:
+        self, normalized_path: str, path_is_absolute: bool, rules: List[_IndexedPathMappingRule]
+    ) -> _IndexedPathMappingRule | None:
         """
         What rule applies to a given path?
-        Takes a path and a list of rules.
+        Takes a normalized path, whether it is absolute and a list of indexed rules.
         returns first rule that applies to the path. If no rules maps return None
         """
-        for rule in rules:
-            if (
-                rule
-                and PurePath(path).is_absolute() == PurePath(rule.source_path).is_absolute()
-                and PurePath(os.path.commonpath((path, rule.source_path)))
-                == PurePath(rule.source_path)
+        for indexed_rule in rules:
+            if path_is_absolute == indexed_rule.source_is_absolute and (
+                normalized_path == indexed_rule.normalized_source_path
+                or normalized_path.startswith(indexed_rule.source_prefix)
             ):
-                return rule
+                return indexed_rule
         return None
 
     def _map_ocio_config(self):
@@ -121,10 +183,9 @@ class NukeClient(_ClientInterface):
         ocio_config = nuke_ocio.create_config_from_file(ocio_config_path)
         if nuke_ocio.config_has_absolute_search_paths(ocio_config):
             # make all search paths absolute since the new config will be saved in the nuke temp dir
-            updated_search_paths = [
-                self.map_path(search_path)
-                for search_path in nuke_ocio.get_config_absolute_search_paths(ocio_config)
-            ]
+            updated_search_paths = list(
+                map(self.map_path, nuke_ocio.get_config_absolute_search_paths(ocio_config))
+            )
 
             nuke_ocio.update_config_search_paths(
                 ocio_config=ocio_config, search_paths=updated_search_paths
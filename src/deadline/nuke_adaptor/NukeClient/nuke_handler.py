@@ -16,7 +16,9 @@ if TYPE_CHECKING:  # pragma: no cover
     from nuke import Node
 
 
-NUKE_WRITE_NODE_CLASSES = {"Write", "WriteGeo", "DeepWrite"}
+NUKE_WRITE_NODE_CLASSES = frozenset({"Write", "WriteGeo", "DeepWrite"})
+# A frame range of the form "<startframe>-<endframe>" or "<frame>"
+_FRAME_RANGE_REGEX = re.compile(r"(\d+)(?:-(\d+))?\Z")
 
 
 class NukeHandler:
@@ -59,20 +61,14 @@ class NukeHandler:
             raise Exception("NukeClient: start_render called without a frameRange.")
 
         # FrameRange should be a string of the format "<startframe>-<endframe>" or "<frame>"
-        match = re.match(r"(\d+)-(\d+)", frame_range)
-        if match:
-            start_frame = int(match.group(1))
-            end_frame = int(match.group(2))
-
-        else:
-            match = re.match(r"(\d+)", frame_range)
-            if not match:
-                raise Exception(
-                    f"Invalid frame range {frame_range}. The string frame range must follow the format '<startFrame>-<endFrame>' or '<frame>'"
-                )
+        match = _FRAME_RANGE_REGEX.match(frame_range)
+        if not match:
+            raise Exception(
+                f"Invalid frame range {frame_range}. The string frame range must follow the format '<startFrame>-<endFrame>' or '<frame>'"
+            )
 
-            start_frame = int(frame_range)
-            end_frame = int(frame_range)
+        start_frame = int(match.group(1))
+        end_frame = int(match.group(2) or match.group(1))
 
         if not self.write_nodes:
             self.write_nodes = NukeHandler._get_write_nodes()
@@ -82,8 +78,9 @@ class NukeHandler:
                 flush=True,
             )
 
-        # enforce render order
-        self.write_nodes.sort(key=lambda node: node.knobs()["render_order"].value())
+        # enforce render order. knob() looks up a single knob, where knobs() builds a dict of all
+        # of the node's knobs.
+        self.write_nodes.sort(key=lambda node: node.knob("render_order").value())
 
         # set up progress handling
         output_counts = self._get_all_nodes_total_outputs()
@@ -131,7 +128,7 @@ class NukeHandler:
             # If we aren't setting views to render with, then calculate based each node's views.
             # If there are space names in views there can be errors at render time, and the returned
             # value may be higher than the actual number of expected outputs.
-            return [len(n.knobs()["views"].value().split(" ")) for n in self.write_nodes]
+            return [len(n.knob("views").value().split(" ")) for n in self.write_nodes]
 
     def set_write_nodes(self, data: dict) -> None:
         """
@@ -256,8 +253,11 @@ class NukeHandler:
         """
         if not isinstance(value, list):
             raise TypeError(f"Expected type list[str] for {name}. Got {type(value).__name__}.")
-        elif not all(isinstance(node, str) for node in value):
-            types = set(type(node).__name__ for node in value)
+        # Collect the distinct element types in one C-level pass, so only those few types need
+        # checking rather than every element
+        value_types = frozenset(map(type, value))
+        if not all(issubclass(value_type, str) for value_type in value_types):
+            types = set(value_type.__name__ for value_type in value_types)
             raise TypeError(f"Expected type list[str] for {name}. Got list[{', '.join(types)}].")
         if not value:
             raise RuntimeError(f"No {name} were specified.")
@@ -17,22 +17,19 @@ class NukeLogger(logging.Logger):
     def __init__(self, name):
         super().__init__(name)
 
-        log_file = self.log_path
-
-        if not os.path.exists(os.path.dirname(log_file)):
+        try:
             # make sure the directories exist.
-            try:
-                os.makedirs(os.path.dirname(log_file))
-            except (IOError, OSError):
-                log_file = os.path.join(tempfile.gettempdir(), f"nuke.{os.getpid()}.log")
-
-        if not os.access(os.path.dirname(log_file), os.W_OK | os.R_OK):
-            # if we can't access the log file use a temp file.
-            log_file = os.path.join(tempfile.gettempdir(), f"nuke.{os.getpid()}.log")
-
-        disk_handler = logging.handlers.RotatingFileHandler(
-            log_file, maxBytes=10485760, backupCount=5
-        )
+            os.makedirs(os.path.dirname(self.log_path), exist_ok=True)
+            disk_handler = logging.handlers.RotatingFileHandler(
+                self.log_path, maxBytes=10485760, backupCount=5
+            )
+        except OSError:
+            # if we can't create or open the log file use a temp file.
+            disk_handler = logging.handlers.RotatingFileHandler(
+                os.path.join(tempfile.gettempdir(), f"nuke.{os.getpid()}.log"),
+                maxBytes=10485760,
+                backupCount=5,
+            )
 
         # we use a different format for the disk log, to get a time stamp.
         fmtf = logging.Formatter(
@@ -4,8 +4,8 @@ from __future__ import annotations
 
 import os
 import re
-from collections.abc import Generator
-from os.path import commonpath, dirname, join, normpath, samefile
+from collections.abc import Generator, Iterable
+from os.path import dirname, join, normcase, normpath
 from sys import platform
 import nuke
 
@@ -15,7 +15,7 @@ from deadline.nuke_util import ocio as nuke_ocio
 
 FRAME_REGEX = re.compile(r"(#+)|%(\d*)d", re.IGNORECASE)
 FILE_KNOB_CLASS = "File_Knob"
-NUKE_WRITE_NODE_CLASSES: set[str] = {"Write", "DeepWrite", "WriteGeo"}
+NUKE_WRITE_NODE_CLASSES: frozenset[str] = frozenset({"Write", "DeepWrite", "WriteGeo"})
 JOB_ID_REGEX = re.compile(r"^job-[0-9a-z]{32}$")
 
 
@@ -35,6 +35,23 @@ def get_project_path() -> str:
     return project_path
 
 
+def _get_install_path() -> str:
+    """Gets the directory Nuke is installed in"""
+    # Windows / Linux
+    install_path = dirname(nuke.EXE_PATH)
+    if platform.startswith("darwin"):
+        # EXE_PATH: /Applications/Nuke15.0v2/Nuke15.0v2.app/Contents/MacOS/Nuke15.0
+        # INSTALL_PATH: /Applications/Nuke15.0v2/Nuke15.0v2.app
+        install_path = dirname(dirname(dirname(nuke.EXE_PATH)))
+    return install_path
+
+
+def _get_install_prefix() -> str:
+    """Gets the normalized prefix shared by every path inside the Nuke install directory"""
+    install_path = normcase(normpath(_get_install_path()))
+    return install_path if install_path.endswith(os.sep) else install_path + os.sep
+
+
 def get_scene_asset_references() -> AssetReferences:
     """Traverses all nodes to determine both input and output asset references"""
     nuke.tprint("Walking node graph to auto-detect input/output asset references...")
@@ -45,9 +62,15 @@ def get_scene_asset_references() -> AssetReferences:
             "The Nuke Script is not saved to disk. Please save it before opening the submitter dialog."
         )
     asset_references.input_filenames.add(script_file)
+    # Neither can change while walking the graph, so evaluate them once rather than per node
+    project_path = get_project_path()
+    root_node = nuke.root()
+    # Filenames already checked with isdir, since many nodes can read the same files
+    checked_filenames: set[str] = set()
     for node in nuke.allNodes(recurseGroups=True):
         # do not need assets for disabled nodes
-        if node.knob("disable") and node.knob("disable").value():
+        disable_knob = node.knob("disable")
+        if disable_knob and disable_knob.value():
             continue
 
         # write nodes can be turned into read nodes to avoid recomputation
@@ -57,28 +80,20 @@ def get_scene_asset_references() -> AssetReferences:
             is_read_node = read_knob.value()
 
         if is_read_node or node.Class() not in NUKE_WRITE_NODE_CLASSES:
-            for filename in get_node_filenames(node):
-                # if the filename is in the install dir, ignore it.
-                if node is nuke.root():
-                    # Windows / Linux
-                    install_path = dirname(nuke.EXE_PATH)
-                    if platform.startswith("darwin"):
-                        # EXE_PATH: /Applications/Nuke15.0v2/Nuke15.0v2.app/Contents/MacOS/Nuke15.0
-                        # INSTALL_PATH: /Applications/Nuke15.0v2/Nuke15.0v2.app
-                        install_path = dirname(dirname(dirname(nuke.EXE_PATH)))
-                    try:
-                        common_file_path = commonpath((filename, install_path))
-                    except ValueError:
-                        # Occurs if different drives, or mix of absolute + relative paths
-                        pass
-                    else:
-                        if samefile(install_path, common_file_path):
-                            continue
+            # if the filename is in the install dir, ignore it.
+            install_prefix = _get_install_prefix() if node is root_node else None
+            for filename in get_node_filenames(node, project_path):
+                if install_prefix is not None and normcase(filename).startswith(install_prefix):
+                    continue
+                if filename in checked_filenames:
+                    continue
+                checked_filenames.add(filename)
                 if not os.path.isdir(filename):
                     asset_references.input_filenames.add(filename)
         else:
-            for filename in get_node_filenames(node):
-                asset_references.output_directories.add(dirname(filename))
+            asset_references.output_directories.update(
+                get_node_output_directories(node, project_path)
+            )
 
     if nuke_ocio.is_OCIO_enabled():
         # Determine and add the config file and associated search directories
@@ -121,42 +136,66 @@ def find_all_write_nodes() -> set:
     return write_nodes
 
 
-def get_node_filenames(node) -> set[str]:
+def get_node_filenames(node, project_path: str | None = None) -> set[str]:
     """Searches through all of a node's file knobs for potential filenames.
 
     Handles '%04d' or '####' style padding
     """
     filenames: set[str] = set()
-    for path in get_node_file_knob_paths(node):
-        found_frame_pattern = FRAME_REGEX.search(path)
-        if not found_frame_pattern:
-            filenames.add(path)
-            continue
-
-        # frame token pattern exists in filename
-        if found_frame_pattern.group(1):  # (#+)
-            padding_length = len(found_frame_pattern.group(1))  # type: int
-        else:  # %(\d*)d
-            # If no integer is provided, use 1 for the padding
-            padding_length = 1
-            if found_frame_pattern.group(2):
-                padding_length = int(found_frame_pattern.group(2))
-
-        for frame in node.frameRange():
-            evaluated_frame_string = str(frame).zfill(padding_length)
-            evaluated_filename = FRAME_REGEX.sub(evaluated_frame_string, path)  # type: str
-            filenames.add(evaluated_filename)
+    for path in get_node_file_knob_paths(node, project_path):
+        filenames.update(_expand_frame_tokens(node, path))
 
     return filenames
 
 
-def get_node_file_knob_paths(node) -> Generator[str, None, None]:
-    """Gets all file paths associated with a node"""
-    project_path = get_project_path()
+def get_node_output_directories(node, project_path: str | None = None) -> set[str]:
+    """Gets the directories a node's file knobs write to.
+
+    Frames are only expanded when the directory itself contains a frame token
+    """
+    directories: set[str] = set()
+    for path in get_node_file_knob_paths(node, project_path):
+        directories.update(_expand_frame_tokens(node, dirname(path)))
+
+    return directories
+
+
+def _expand_frame_tokens(node, path: str) -> Iterable[str]:
+    """Replaces the frame tokens in path with each frame in the node's frame range"""
+    # Every frame token contains "#" or "%", so most paths can skip the regex entirely
+    if "#" not in path and "%" not in path:
+        return (path,)
+
+    found_frame_pattern = FRAME_REGEX.search(path)
+    if not found_frame_pattern:
+        return (path,)
+
+    # frame token pattern exists in filename
+    if found_frame_pattern.group(1):  # (#+)
+        padding_length = len(found_frame_pattern.group(1))  # type: int
+    else:  # %(\d*)d
+        # If no integer is provided, use 1 for the padding
+        padding_length = 1
+        if found_frame_pattern.group(2):
+            padding_length = int(found_frame_pattern.group(2))
+
+    # The text around every frame token, split once so each frame is a join instead of a
+    # regex substitution. FRAME_REGEX has two groups, so every third item is literal text.
+    path_segments = FRAME_REGEX.split(path)[::3]
+    return {str(frame).zfill(padding_length).join(path_segments) for frame in node.frameRange()}
+
+
+def get_node_file_knob_paths(node, project_path: str | None = None) -> Generator[str, None, None]:
+    """Gets all file paths associated with a node, relative to project_path if given"""
+    if project_path is None:
+        project_path = get_project_path()
     for knob in node.allKnobs():
-        if knob.Class() == FILE_KNOB_CLASS and knob.value():
-            # If the knob value starts with a tcl expression, we evaluate it
-            if knob.value().startswith("["):
-                yield normpath(join(project_path, knob.getEvaluatedValue()))
-            else:
-                yield normpath(join(project_path, knob.value()))
+        if knob.Class() != FILE_KNOB_CLASS:
+            continue
+        knob_value = knob.value()
+        if not knob_value:
+            continue
+        # If the knob value starts with a tcl expression, we evaluate it
+        if knob_value.startswith("["):
+            knob_value = knob.getEvaluatedValue()
+        yield normpath(join(project_path, knob_value))
@@ -81,4 +81,6 @@ class RenderSubmitterUISettings:  # pylint: disable=too-many-instance-attributes
                 for field in dataclasses.fields(self)
                 if field.metadata.get("sticky")
             }
-            json.dump(obj, fh, indent=1)
+            # json.dump writes each encoded fragment separately, which is slow for long attachment
+            # lists, so encode the whole document first and write it once
+            fh.write(json.dumps(obj, indent=1))
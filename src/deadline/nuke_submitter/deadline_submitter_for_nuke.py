@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import copy
 import os
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional
 import yaml  # type: ignore[import]
@@ -37,6 +39,11 @@ from deadline.client.job_bundle.submission import AssetReferences
 from deadline.client.exceptions import DeadlineOperationError
 
 g_submitter_dialog = None
+# The libyaml based loader is much faster, but PyYAML can be installed without libyaml
+_YAML_SAFE_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_FRAME_RANGE_REGEX = re.compile(r"(\d+)-(\d+)")
+# Read DEVELOPMENT.md for instructions to create the wheels directory.
+_WHEELS_PATH = Path(__file__).parent.parent.parent.parent / "wheels"
 
 
 def show_nuke_render_submitter_noargs() -> "SubmitJobToDeadlineDialog":
@@ -61,7 +68,10 @@ def _set_timeouts(template: dict[str, Any], settings: RenderSubmitterUISettings)
     Timeouts are an OpenJD field applicable to actions but for specification 2023-09, timeouts must
     be hard-coded in the job template. There are three types of actions: OnRun, onEnter, and onExit.
     This function does an in-place modification of timeout values for each action in the template.
+    If timeouts are disabled the template is left without them.
     """
+    if not settings.timeouts_enabled:
+        return
 
     def _handle_environment(environment: dict):
         if "script" in environment:
@@ -139,11 +149,22 @@ def _remove_ocio_path_from_job_template(job_template: dict[str, Any]) -> None:
             break
 
 
+@lru_cache(maxsize=None)
+def _parse_bundled_yaml(filename: str) -> Any:
+    """Parses a YAML file shipped with the submitter. The result is shared, so do not modify it"""
+    with open(Path(__file__).parent / filename) as f:
+        return yaml.load(f, Loader=_YAML_SAFE_LOADER)
+
+
+def _load_bundled_yaml(filename: str) -> Any:
+    """Returns a copy of a YAML file shipped with the submitter that the caller may modify"""
+    return copy.deepcopy(_parse_bundled_yaml(filename))
+
+
 def _get_job_template(settings: RenderSubmitterUISettings) -> dict[str, Any]:
     # Load the default Nuke job template, and then fill in scene-specific
     # values it needs.
-    with open(Path(__file__).parent / "default_nuke_job_template.yaml") as f:
-        job_template = yaml.safe_load(f)
+    job_template = _load_bundled_yaml("default_nuke_job_template.yaml")
 
     # Set the job's name and description
     job_template["name"] = settings.name
@@ -179,18 +200,15 @@ def _get_job_template(settings: RenderSubmitterUISettings) -> dict[str, Any]:
 
     # If this developer option is enabled, merge the adaptor_override_environment
     if settings.include_adaptor_wheels:
-        with open(Path(__file__).parent / "adaptor_override_environment.yaml") as f:
-            override_environment = yaml.safe_load(f)
+        override_environment = _load_bundled_yaml("adaptor_override_environment.yaml")
 
-        # Read DEVELOPMENT.md for instructions to create the wheels directory.
-        wheels_path = Path(__file__).parent.parent.parent.parent / "wheels"
-        if not wheels_path.is_dir():
+        if not _WHEELS_PATH.is_dir():
             raise RuntimeError(
                 "The Developer Option 'Include Adaptor Wheels' is enabled, but the wheels directory does not exist:\n"
-                + str(wheels_path)
+                + str(_WHEELS_PATH)
             )
         wheels_path_package_names = {
-            path.split("-", 1)[0] for path in os.listdir(wheels_path) if path.endswith(".whl")
+            path.split("-", 1)[0] for path in os.listdir(_WHEELS_PATH) if path.endswith(".whl")
         }
         if wheels_path_package_names != {
             "openjd_adaptor_runtime",
@@ -203,11 +221,11 @@ def _get_job_template(settings: RenderSubmitterUISettings) -> dict[str, Any]:
                 + f"Actual: {wheels_path_package_names}"
             )
 
-        override_adaptor_name_param = [
+        override_adaptor_name_param = next(
             param
             for param in override_environment["parameterDefinitions"]
             if param["name"] == "OverrideAdaptorName"
-        ][0]
+        )
         override_adaptor_name_param["default"] = "NukeAdaptor"
 
         # There are no parameter conflicts between these two templates, so this works
@@ -221,13 +239,12 @@ def _get_job_template(settings: RenderSubmitterUISettings) -> dict[str, Any]:
     # Determine whether this is a movie render. If it is, we want to ensure that the entire Nuke
     # evaluation is placed on one task.
     write_node, write_node_name = _get_write_node(settings)
-    movie_render = "file_type" in write_node.knobs() and write_node["file_type"].value() in [
-        "mov",
-        "mxf",
-    ]
+    # knob() returns None when the node has no such knob, which avoids building the knobs() dict
+    file_type_knob = write_node.knob("file_type")
+    movie_render = file_type_knob is not None and file_type_knob.value() in ["mov", "mxf"]
     if movie_render:
         frame_list = _get_frame_list(settings, write_node, write_node_name)
-        match = re.match(r"(\d+)-(\d+)", frame_list)
+        match = _FRAME_RANGE_REGEX.match(frame_list)
         if not match:
             raise DeadlineOperationError(
                 f"Invalid frame range {frame_list} for evaluating a MOV render. Frame range must follow the format 'startFrame - endFrame'"
@@ -283,15 +300,14 @@ def _get_parameter_values(
                 "OCIO is enabled but OCIO config file is not specified. Please check and update the config file before proceeding."
             )
     if settings.include_adaptor_wheels:
-        wheels_path = str(Path(__file__).parent.parent.parent.parent / "wheels")
-        parameter_values.append({"name": "AdaptorWheels", "value": wheels_path})
+        parameter_values.append({"name": "AdaptorWheels", "value": str(_WHEELS_PATH)})
 
     # Check for any overlap between the job parameters we've defined and the
     # queue parameters. This is an error, as we weren't synchronizing the values
     # between the two different tabs where they came from.
     parameter_names = {param["name"] for param in parameter_values}
-    queue_parameter_names = {param["name"] for param in queue_parameters}
-    parameter_overlap = parameter_names.intersection(queue_parameter_names)
+    queue_parameters_by_name = {param["name"]: param for param in queue_parameters}
+    parameter_overlap = [name for name in queue_parameters_by_name if name in parameter_names]
     if parameter_overlap:
         raise DeadlineOperationError(
             "The following queue parameters conflict with the Nuke job parameters:\n"
@@ -300,14 +316,9 @@ def _get_parameter_values(
 
     # If we're overriding the adaptor with wheels, remove the adaptor from the Packages parameters
     if settings.include_adaptor_wheels:
-        rez_param = {}
-        conda_param = {}
         # Find the Packages parameter definition
-        for param in queue_parameters:
-            if param["name"] == "RezPackages":
-                rez_param = param
-            if param["name"] == "CondaPackages":
-                conda_param = param
+        rez_param = queue_parameters_by_name.get("RezPackages")
+        conda_param = queue_parameters_by_name.get("CondaPackages")
         # Remove the deadline_cloud_for_nuke/nuke-openjd package
         if rez_param:
             rez_param["value"] = " ".join(
@@ -361,7 +372,8 @@ def show_nuke_render_submitter(parent, f=Qt.WindowFlags()) -> "SubmitJobToDeadli
             "The Nuke Script is not saved to disk. Please save it before opening the submitter dialog."
         )
 
-    if nuke.root().modified():
+    root = nuke.root()
+    if root.modified():
         raise DeadlineOperationError(
             "The Nuke Script has unsaved changes. Please save it before opening the submitter dialog."
         )
@@ -370,8 +382,8 @@ def show_nuke_render_submitter(parent, f=Qt.WindowFlags()) -> "SubmitJobToDeadli
 
     # Set the setting defaults that come from the scene
     render_settings.name = Path(script_path).name
-    render_settings.frame_list = str(nuke.root().frameRange())
-    render_settings.is_proxy_mode = nuke.root().proxy()
+    render_settings.frame_list = str(root.frameRange())
+    render_settings.is_proxy_mode = root.proxy()
 
     # Load the sticky settings
     render_settings.load_sticky_settings(script_path)
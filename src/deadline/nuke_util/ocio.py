@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import os
+from functools import lru_cache
 from pathlib import PurePath
 from typing import Optional
 
@@ -22,9 +23,10 @@ def get_env_config_path() -> Optional[str]:
 
 def is_stock_config_enabled() -> bool:
     """True if the script is using a default OCIO config"""
+    root = nuke.root()
     return (
-        nuke.root().knob("colorManagement").value() == "OCIO"
-        and nuke.root().knob("OCIO_config").value() != "custom"
+        root.knob("colorManagement").value() == "OCIO"
+        and root.knob("OCIO_config").value() != "custom"
     )
 
 
@@ -40,9 +42,10 @@ def is_OCIO_enabled() -> bool:
 
 def is_custom_config_enabled() -> bool:
     """True if the script is using a custom OCIO config"""
+    root = nuke.root()
     return (
-        nuke.root().knob("colorManagement").value() == "OCIO"
-        and nuke.root().knob("OCIO_config").value() == "custom"
+        root.knob("colorManagement").value() == "OCIO"
+        and root.knob("OCIO_config").value() == "custom"
     )
 
 
@@ -64,8 +67,24 @@ def config_has_absolute_search_paths(ocio_config: OCIO.Config) -> bool:
 def get_config_absolute_search_paths(ocio_config: str | OCIO.Config) -> list[str]:
     """Returns the directories containing the LUTs for the provided OCIO config"""
     if isinstance(ocio_config, str):
-        ocio_config = OCIO.Config.CreateFromFile(ocio_config)
+        return list(
+            _get_config_file_absolute_search_paths(ocio_config, os.path.getmtime(ocio_config))
+        )
 
+    return _get_absolute_search_paths(ocio_config)
+
+
+@lru_cache(maxsize=8)
+def _get_config_file_absolute_search_paths(ocio_config_path: str, mtime: float) -> tuple[str, ...]:
+    """
+    Parses the OCIO config file and returns its absolute search paths. The file's modification
+    time is part of the cache key so an edited config is parsed again.
+    """
+    return tuple(_get_absolute_search_paths(OCIO.Config.CreateFromFile(ocio_config_path)))
+
+
+def _get_absolute_search_paths(ocio_config: OCIO.Config) -> list[str]:
+    """Joins each of the OCIO config's search paths onto its working directory"""
     # A config can have multiple search paths and they can be relative or absolute.
     # At least for all of the AMPAS OCIO configs this is always a single relative path to the "luts" directory
     search_paths = ocio_config.getSearchPaths()
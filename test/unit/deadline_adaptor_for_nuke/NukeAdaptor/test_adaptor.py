@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+import logging
 import os
-from unittest.mock import Mock, PropertyMock, call, patch
+import time
+from unittest.mock import MagicMock, Mock, PropertyMock, call, patch
 
 import pytest
 import jsonschema  # type: ignore
+from openjd.adaptor_runtime.app_handlers import RegexHandler
+from openjd.adaptor_runtime_client import Action
 
 import deadline.nuke_adaptor.NukeAdaptor.adaptor as adaptor_module
 from deadline.nuke_adaptor.NukeAdaptor import NukeAdaptor
@@ -14,6 +18,7 @@ from deadline.nuke_adaptor.NukeAdaptor.adaptor import (
     _FIRST_NUKE_ACTIONS,
     _NUKE_INIT_KEYS,
     NukeNotRunningError,
+    _NotifyingActionsQueue,
 )
 
 
@@ -45,9 +50,26 @@ def run_data() -> dict:
     return {"frameRange": "42"}
 
 
+class TestNukeAdaptor_init:
+    """Tests for NukeAdaptor.__init__"""
+
+    def test_instances_do_not_share_queue(self, init_data):
+        """Test that each adaptor gets its own action queue"""
+        # GIVEN
+        adaptor = NukeAdaptor(init_data)
+        other_adaptor = NukeAdaptor(init_data)
+
+        # WHEN
+        adaptor._populate_action_queue()
+
+        # THEN
+        assert len(adaptor._action_queue) > 0
+        assert len(other_adaptor._action_queue) == 0
+
+
 class TestNukeAdaptor_on_start:
     @patch("deadline.nuke_adaptor.NukeAdaptor.adaptor.NukeAdaptor._get_deadline_telemetry_client")
-    @patch("deadline.nuke_adaptor.NukeAdaptor.adaptor.ActionsQueue.__len__", return_value=0)
+    @patch("deadline.nuke_adaptor.NukeAdaptor.adaptor.ActionsQueue.__bool__", return_value=False)
     @patch("deadline.nuke_adaptor.NukeAdaptor.adaptor.LoggingSubprocess")
     @patch("deadline.nuke_adaptor.NukeAdaptor.adaptor.AdaptorServer")
     def test_no_error(
@@ -63,9 +85,33 @@ class TestNukeAdaptor_on_start:
         mock_server.return_value.server_path = "/tmp/9999"
         adaptor.on_start()
 
-    @patch("time.sleep")
     @patch("deadline.nuke_adaptor.NukeAdaptor.adaptor.NukeAdaptor._get_deadline_telemetry_client")
-    @patch("deadline.nuke_adaptor.NukeAdaptor.adaptor.ActionsQueue.__len__", return_value=0)
+    @patch("deadline.nuke_adaptor.NukeAdaptor.adaptor.ActionsQueue.__bool__", return_value=False)
+    @patch("deadline.nuke_adaptor.NukeAdaptor.adaptor.LoggingSubprocess")
+    @patch("deadline.nuke_adaptor.NukeAdaptor.adaptor.AdaptorServer")
+    def test_telemetry_opt_out(
+        self,
+        mock_server: Mock,
+        mock_logging_subprocess: Mock,
+        mock_actions_queue: Mock,
+        mock_telemetry_client: Mock,
+        init_data: dict,
+    ) -> None:
+        """Tests that the telemetry client is not created when telemetry is opted out of"""
+        # GIVEN
+        init_data["telemetry_opt_out"] = True
+        adaptor = NukeAdaptor(init_data)
+        mock_server.return_value.server_path = "/tmp/9999"
+
+        # WHEN
+        adaptor.on_start()
+
+        # THEN
+        mock_telemetry_client.assert_not_called()
+
+    @patch.dict(os.environ, {})
+    @patch("deadline.nuke_adaptor.NukeAdaptor.adaptor.NukeAdaptor._get_deadline_telemetry_client")
+    @patch("deadline.nuke_adaptor.NukeAdaptor.adaptor.ActionsQueue.__bool__", return_value=False)
     @patch("deadline.nuke_adaptor.NukeAdaptor.adaptor.LoggingSubprocess")
     @patch("deadline.nuke_adaptor.NukeAdaptor.adaptor.AdaptorServer")
     def test_waits_for_server_socket(
@@ -74,22 +120,25 @@ class TestNukeAdaptor_on_start:
         mock_logging_subprocess: Mock,
         mock_actions_queue: Mock,
         mock_telemetry_client: Mock,
-        mock_sleep: Mock,
         init_data: dict,
     ) -> None:
-        """Tests that the adaptor waits until the server socket is available"""
+        """Tests that the adaptor waits until the server thread signals the server is ready"""
         # GIVEN
         adaptor = NukeAdaptor(init_data)
-        socket_mock = PropertyMock(
-            side_effect=[None, None, None, "/tmp/9999", "/tmp/9999", "/tmp/9999"]
-        )
-        type(mock_server.return_value).server_path = socket_mock
+        mock_server.return_value.server_path = "/tmp/9999"
+
+        def create_server_slowly(*args, **kwargs):
+            time.sleep(0.1)
+            return mock_server.return_value
+
+        mock_server.side_effect = create_server_slowly
 
         # WHEN
         adaptor.on_start()
 
         # THEN
-        assert mock_sleep.call_count == 3
+        assert adaptor._server_ready.is_set()
+        assert os.environ["NUKE_ADAPTOR_SERVER_PATH"] == "/tmp/9999"
 
     @patch("threading.Thread")
     @patch("deadline.nuke_adaptor.NukeAdaptor.adaptor.AdaptorServer")
@@ -121,24 +170,72 @@ class TestNukeAdaptor_on_start:
         # GIVEN
         adaptor = NukeAdaptor(init_data)
         test_dir = "test_dir"
+        mock_spec = Mock(submodule_search_locations=[test_dir])
 
-        with patch.object(adaptor_module.sys, "path", ["unreported_dir", test_dir]):
+        with patch.object(adaptor_module.importlib.util, "find_spec", return_value=mock_spec):
             with pytest.raises(FileNotFoundError) as exc_info:
                 # WHEN
                 adaptor.nuke_client_path
 
         # THEN
         error_msg = (
-            "Could not find nuke_client.py. Check that the NukeClient package is in "
+            "Could not find nuke_client.py. Check that the NukeClient package is installed in "
             f"one of the following directories: {[test_dir]}"
         )
         assert str(exc_info.value) == error_msg
-        mock_isfile.assert_called_with(
-            os.path.join(test_dir, "deadline", "nuke_adaptor", "NukeClient", "nuke_client.py")
+        mock_isfile.assert_called_with(os.path.join(test_dir, "nuke_client.py"))
+
+    @pytest.mark.parametrize("python_path", [None, "", "/some/dir"])
+    @patch("deadline.nuke_adaptor.NukeAdaptor.adaptor.LoggingSubprocess")
+    def test_client_python_path(
+        self, mock_logging_subprocess: Mock, init_data: dict, python_path: str | None
+    ) -> None:
+        """Tests that the namespace directories are added to PYTHONPATH exactly once"""
+        # GIVEN
+        adaptor = NukeAdaptor(init_data)
+        env = {} if python_path is None else {"PYTHONPATH": python_path}
+        expected_dirs = ([python_path] if python_path else []) + list(
+            adaptor_module._PYTHONPATH_DIRS
+        )
+
+        with patch.dict(os.environ, env, clear=True):
+            # WHEN
+            adaptor._start_nuke_client()
+            adaptor._start_nuke_client()
+
+            # THEN
+            assert os.environ["PYTHONPATH"].split(os.pathsep) == expected_dirs
+
+    def test_client_package_not_found(self, init_data: dict) -> None:
+        """Tests that the an error is raised if the NukeClient package cannot be found"""
+        # GIVEN
+        adaptor = NukeAdaptor(init_data)
+
+        with patch.object(adaptor_module.importlib.util, "find_spec", return_value=None):
+            with pytest.raises(FileNotFoundError):
+                # WHEN
+                adaptor.nuke_client_path
+
+    @patch.object(adaptor_module.os.path, "isfile", wraps=os.path.isfile)
+    def test_client_path_cache(self, mock_isfile: Mock, init_data: dict) -> None:
+        """Tests that the nuke client file is only looked up once"""
+        # GIVEN
+        adaptor = NukeAdaptor(init_data)
+
+        # WHEN
+        nuke_client_path = adaptor.nuke_client_path
+
+        # THEN
+        assert adaptor.nuke_client_path == nuke_client_path
+        assert nuke_client_path == os.path.join(
+            os.path.dirname(adaptor_module.deadline.nuke_adaptor.__file__),
+            "NukeClient",
+            "nuke_client.py",
         )
+        mock_isfile.assert_called_once()
 
     @patch("deadline.nuke_adaptor.NukeAdaptor.adaptor.NukeAdaptor._get_deadline_telemetry_client")
-    @patch("deadline.nuke_adaptor.NukeAdaptor.adaptor.ActionsQueue.__len__", return_value=1)
+    @patch("deadline.nuke_adaptor.NukeAdaptor.adaptor.ActionsQueue.__bool__", return_value=True)
     @patch("deadline.nuke_adaptor.NukeAdaptor.adaptor.LoggingSubprocess")
     @patch("deadline.nuke_adaptor.NukeAdaptor.adaptor.AdaptorServer")
     def test_nuke_init_timeout(
@@ -174,7 +271,7 @@ class TestNukeAdaptor_on_start:
 
     @patch.object(NukeAdaptor, "_nuke_is_running", False)
     @patch("deadline.nuke_adaptor.NukeAdaptor.adaptor.NukeAdaptor._get_deadline_telemetry_client")
-    @patch("deadline.nuke_adaptor.NukeAdaptor.adaptor.ActionsQueue.__len__", return_value=1)
+    @patch("deadline.nuke_adaptor.NukeAdaptor.adaptor.ActionsQueue.__bool__", return_value=True)
     @patch("deadline.nuke_adaptor.NukeAdaptor.adaptor.LoggingSubprocess")
     @patch("deadline.nuke_adaptor.NukeAdaptor.adaptor.AdaptorServer")
     def test_nuke_init_fail(
@@ -201,7 +298,7 @@ class TestNukeAdaptor_on_start:
         assert str(exc_info.value) == error_msg
 
     @patch("deadline.nuke_adaptor.NukeAdaptor.adaptor.NukeAdaptor._get_deadline_telemetry_client")
-    @patch.object(NukeAdaptor, "_action_queue")
+    @patch("deadline.nuke_adaptor.NukeAdaptor.adaptor._NotifyingActionsQueue")
     @patch("deadline.nuke_adaptor.NukeAdaptor.adaptor.LoggingSubprocess")
     @patch("deadline.nuke_adaptor.NukeAdaptor.adaptor.AdaptorServer")
     def test_populate_action_queue(
@@ -214,7 +311,7 @@ class TestNukeAdaptor_on_start:
     ) -> None:
         """Tests that the action queue is populated correctly"""
         # GIVEN
-        mock_actions_queue.__len__.return_value = 0
+        mock_actions_queue.return_value.__bool__.return_value = False
         adaptor = NukeAdaptor(init_data)
         mock_server.return_value.server_path = "/tmp/9999"
 
@@ -222,7 +319,7 @@ class TestNukeAdaptor_on_start:
         adaptor.on_start()
 
         # THEN
-        calls = mock_actions_queue.enqueue_action.call_args_list
+        calls = mock_actions_queue.return_value.enqueue_action.call_args_list
         for _call, name in zip(calls[: len(_FIRST_NUKE_ACTIONS)], _FIRST_NUKE_ACTIONS):
             assert _call.args[0].name == name, f"Action: {name} missing from first actions"
         for _call, name in zip(
@@ -231,7 +328,7 @@ class TestNukeAdaptor_on_start:
         ):
             assert _call.args[0].name == name, f"Action: {name} missing from init actions"
 
-    @patch.object(NukeAdaptor, "_action_queue")
+    @patch("deadline.nuke_adaptor.NukeAdaptor.adaptor._NotifyingActionsQueue")
     @patch("deadline.nuke_adaptor.NukeAdaptor.adaptor.NukeAdaptor._get_deadline_telemetry_client")
     @patch("deadline.nuke_adaptor.NukeAdaptor.adaptor.LoggingSubprocess")
     @patch("deadline.nuke_adaptor.NukeAdaptor.adaptor.AdaptorServer")
@@ -250,7 +347,7 @@ class TestNukeAdaptor_on_start:
             "script_file": "/path/to/some/nukescript.nk",
             "continue_on_error": True,
         }
-        mock_actions_queue.__len__.return_value = 0
+        mock_actions_queue.return_value.__bool__.return_value = False
         adaptor = NukeAdaptor(init_data)
         mock_server.return_value.server_path = "/tmp/9999"
         expected_action_names_queued = init_data.keys() & _NUKE_INIT_KEYS | set(_FIRST_NUKE_ACTIONS)
@@ -259,7 +356,7 @@ class TestNukeAdaptor_on_start:
         adaptor.on_start()
 
         # THEN
-        calls = mock_actions_queue.enqueue_action.call_args_list
+        calls = mock_actions_queue.return_value.enqueue_action.call_args_list
         assert len(calls) == len(expected_action_names_queued)
         for _call in calls:
             assert _call.args[0].name in expected_action_names_queued
@@ -284,10 +381,18 @@ class TestNukeAdaptor_on_start:
         assert error_msg in exc_info.value.message
 
 
+def _render_completes_on_wait(adaptor: NukeAdaptor):
+    """Patches the adaptor's state wait so that the render finishes the first time on_run waits"""
+    return patch.object(
+        adaptor._state_cond,
+        "wait",
+        side_effect=lambda timeout: setattr(adaptor, "_is_rendering", False),
+    )
+
+
 class TestNukeAdaptor_on_run:
-    @patch("time.sleep")
     @patch("deadline.nuke_adaptor.NukeAdaptor.adaptor.NukeAdaptor._get_deadline_telemetry_client")
-    @patch("deadline.nuke_adaptor.NukeAdaptor.adaptor.ActionsQueue.__len__", return_value=0)
+    @patch("deadline.nuke_adaptor.NukeAdaptor.adaptor.ActionsQueue.__bool__", return_value=False)
     @patch("deadline.nuke_adaptor.NukeAdaptor.adaptor.LoggingSubprocess")
     @patch("deadline.nuke_adaptor.NukeAdaptor.adaptor.AdaptorServer")
     def test_on_run(
@@ -296,7 +401,6 @@ class TestNukeAdaptor_on_run:
         mock_logging_subprocess: Mock,
         mock_actions_queue: Mock,
         mock_telemetry_client: Mock,
-        mock_sleep: Mock,
         init_data: dict,
         run_data: dict,
     ) -> None:
@@ -304,28 +408,21 @@ class TestNukeAdaptor_on_run:
         # GIVEN
         adaptor = NukeAdaptor(init_data)
         mock_server.return_value.server_path = "/tmp/9999"
-        # First side_effect value consumed by setter
-        is_rendering_mock = PropertyMock(side_effect=[None, True, False])
-        NukeAdaptor._is_rendering = is_rendering_mock
         adaptor.on_start()
 
         # WHEN
-        adaptor.on_run(run_data)
+        with _render_completes_on_wait(adaptor) as mock_wait:
+            adaptor.on_run(run_data)
 
         # THEN
-        mock_sleep.assert_called_once_with(0.1)
+        mock_wait.assert_called_once_with(0.1)
 
-    @patch("time.sleep")
-    @patch(
-        "deadline.nuke_adaptor.NukeAdaptor.adaptor.NukeAdaptor._is_rendering",
-        new_callable=PropertyMock,
-    )
     @patch(
         "deadline.nuke_adaptor.NukeAdaptor.adaptor.NukeAdaptor._nuke_is_running",
         new_callable=PropertyMock,
     )
     @patch("deadline.nuke_adaptor.NukeAdaptor.adaptor.NukeAdaptor._get_deadline_telemetry_client")
-    @patch("deadline.nuke_adaptor.NukeAdaptor.adaptor.ActionsQueue.__len__", return_value=0)
+    @patch("deadline.nuke_adaptor.NukeAdaptor.adaptor.ActionsQueue.__bool__", return_value=False)
     @patch("deadline.nuke_adaptor.NukeAdaptor.adaptor.LoggingSubprocess")
     @patch("deadline.nuke_adaptor.NukeAdaptor.adaptor.AdaptorServer")
     def test_on_run_render_fail(
@@ -335,14 +432,11 @@ class TestNukeAdaptor_on_run:
         mock_actions_queue: Mock,
         mock_telemetry_client: Mock,
         mock_nuke_is_running: Mock,
-        mock_is_rendering: Mock,
-        mock_sleep: Mock,
         init_data: dict,
         run_data: dict,
     ) -> None:
         """Tests that on_run raises an error if the render fails"""
         # GIVEN
-        mock_is_rendering.side_effect = [None, True, False]
         mock_nuke_is_running.side_effect = [True, True, True, False, False]
         mock_logging_subprocess.return_value.returncode = 1
         adaptor = NukeAdaptor(init_data)
@@ -350,11 +444,14 @@ class TestNukeAdaptor_on_run:
         adaptor.on_start()
 
         # WHEN
-        with pytest.raises(RuntimeError) as exc_info:
+        with (
+            patch.object(adaptor._state_cond, "wait") as mock_wait,
+            pytest.raises(RuntimeError) as exc_info,
+        ):
             adaptor.on_run(run_data)
 
         # THEN
-        mock_sleep.assert_called_once_with(0.1)
+        mock_wait.assert_called_once_with(0.1)
         assert mock_telemetry_client.call_count == 2  # once on start, once on error
         assert str(exc_info.value) == (
             "Nuke exited early and did not render successfully, please check render logs. "
@@ -366,7 +463,7 @@ class TestNukeAdaptor_on_run:
         new_callable=PropertyMock,
     )
     @patch("deadline.nuke_adaptor.NukeAdaptor.adaptor.NukeAdaptor._get_deadline_telemetry_client")
-    @patch("deadline.nuke_adaptor.NukeAdaptor.adaptor.ActionsQueue.__len__", return_value=0)
+    @patch("deadline.nuke_adaptor.NukeAdaptor.adaptor.ActionsQueue.__bool__", return_value=False)
     @patch("deadline.nuke_adaptor.NukeAdaptor.adaptor.LoggingSubprocess")
     @patch("deadline.nuke_adaptor.NukeAdaptor.adaptor.AdaptorServer")
     def test_run_data_wrong_schema(
@@ -396,9 +493,8 @@ class TestNukeAdaptor_on_run:
 
 
 class TestNukeAdaptor_on_stop:
-    @patch("time.sleep")
     @patch("deadline.nuke_adaptor.NukeAdaptor.adaptor.NukeAdaptor._get_deadline_telemetry_client")
-    @patch("deadline.nuke_adaptor.NukeAdaptor.adaptor.ActionsQueue.__len__", return_value=0)
+    @patch("deadline.nuke_adaptor.NukeAdaptor.adaptor.ActionsQueue.__bool__", return_value=False)
     @patch("deadline.nuke_adaptor.NukeAdaptor.adaptor.LoggingSubprocess")
     @patch("deadline.nuke_adaptor.NukeAdaptor.adaptor.AdaptorServer")
     def test_on_stop(
@@ -407,17 +503,15 @@ class TestNukeAdaptor_on_stop:
         mock_logging_subprocess: Mock,
         mock_actions_queue: Mock,
         mock_telemetry_client: Mock,
-        mock_sleep: Mock,
         init_data: dict,
         run_data: dict,
     ) -> None:
         # GIVEN
         adaptor = NukeAdaptor(init_data)
         mock_server.return_value.server_path = "/tmp/9999"
-        is_rendering_mock = PropertyMock(return_value=False)
-        NukeAdaptor._is_rendering = is_rendering_mock
         adaptor.on_start()
-        adaptor.on_run(run_data)
+        with _render_completes_on_wait(adaptor):
+            adaptor.on_run(run_data)
 
         try:
             # WHEN
@@ -430,10 +524,9 @@ class TestNukeAdaptor_on_stop:
 
 
 class TestNukeAdaptor_on_cleanup:
-    @patch("time.sleep")
     @patch("deadline.nuke_adaptor.NukeAdaptor.adaptor._logger")
     def test_on_cleanup_nuke_not_graceful_shutdown(
-        self, mock_logger: Mock, mock_sleep: Mock, init_data: dict
+        self, mock_logger: Mock, init_data: dict
     ) -> None:
         """Tests that on_cleanup reports when nuke does not gracefully shutdown"""
         # GIVEN
@@ -445,6 +538,7 @@ class TestNukeAdaptor_on_cleanup:
                 new_callable=lambda: True,
             ),
             patch.object(adaptor, "_NUKE_END_TIMEOUT_SECONDS", 0.01),
+            patch.object(adaptor, "_STATE_POLL_INTERVAL_SECONDS", 0.01),
             patch.object(adaptor, "_nuke_client") as mock_client,
         ):
             # WHEN
@@ -456,10 +550,9 @@ class TestNukeAdaptor_on_cleanup:
         )
         mock_client.terminate.assert_called_once()
 
-    @patch("time.sleep")
     @patch("deadline.nuke_adaptor.NukeAdaptor.adaptor._logger")
     def test_on_cleanup_server_not_graceful_shutdown(
-        self, mock_logger: Mock, mock_sleep: Mock, init_data: dict
+        self, mock_logger: Mock, init_data: dict
     ) -> None:
         """Tests that on_cleanup reports when the server does not shutdown"""
         # GIVEN
@@ -481,11 +574,8 @@ class TestNukeAdaptor_on_cleanup:
         mock_logger.error.assert_called_once_with("Failed to shutdown the Nuke Adaptor server.")
         mock_server_thread.join.assert_called_once_with(timeout=0.01)
 
-    @patch("time.sleep")
     @patch("deadline.nuke_adaptor.NukeAdaptor.adaptor._logger")
-    def test_on_cleanup_server_thread_shutdown(
-        self, mock_logger: Mock, mock_sleep: Mock, init_data: dict
-    ) -> None:
+    def test_on_cleanup_server_thread_shutdown(self, mock_logger: Mock, init_data: dict) -> None:
         """Tests that on_cleanup reports when the server does not shutdown"""
         # GIVEN
         adaptor = NukeAdaptor(init_data)
@@ -506,9 +596,8 @@ class TestNukeAdaptor_on_cleanup:
         mock_logger.error.assert_not_called()
         mock_server_thread.join.assert_called_once_with(timeout=0.01)
 
-    @patch("time.sleep")
     @patch("deadline.nuke_adaptor.NukeAdaptor.adaptor.NukeAdaptor._get_deadline_telemetry_client")
-    @patch("deadline.nuke_adaptor.NukeAdaptor.adaptor.ActionsQueue.__len__", return_value=0)
+    @patch("deadline.nuke_adaptor.NukeAdaptor.adaptor.ActionsQueue.__bool__", return_value=False)
     @patch("deadline.nuke_adaptor.NukeAdaptor.adaptor.LoggingSubprocess")
     @patch("deadline.nuke_adaptor.NukeAdaptor.adaptor.AdaptorServer")
     def test_on_cleanup(
@@ -517,18 +606,16 @@ class TestNukeAdaptor_on_cleanup:
         mock_logging_subprocess: Mock,
         mock_actions_queue: Mock,
         mock_telemetry_client: Mock,
-        mock_sleep: Mock,
         init_data: dict,
         run_data: dict,
     ) -> None:
         # GIVEN
         adaptor = NukeAdaptor(init_data)
         mock_server.return_value.server_path = "/tmp/9999"
-        is_rendering_mock = PropertyMock(return_value=False)
-        NukeAdaptor._is_rendering = is_rendering_mock
 
         adaptor.on_start()
-        adaptor.on_run(run_data)
+        with _render_completes_on_wait(adaptor):
+            adaptor.on_run(run_data)
         adaptor.on_stop()
 
         with patch(
@@ -557,13 +644,12 @@ class TestNukeAdaptor_on_cleanup:
         """Tests that the _handle_complete method updates the progress correctly"""
         # GIVEN
         adaptor = NukeAdaptor(init_data)
-        regex_callbacks = adaptor.regex_callbacks
-        complete_regex = regex_callbacks[0].regex_list[0]
+        regex_callback = adaptor.regex_callbacks[0]
 
         # WHEN
-        match = complete_regex.search("NukeClient: Finished Rendering Frame 1")
+        match = regex_callback.get_match("NukeClient: Finished Rendering Frame 1")
         if match:
-            adaptor._handle_complete(match)
+            regex_callback.callback(match)
 
         # THEN
         assert match is not None
@@ -571,7 +657,6 @@ class TestNukeAdaptor_on_cleanup:
 
     handle_progress_params = [
         (
-            (1, 2),
             (
                 "NukeClient: Creating outputs 0-1 of 10 total outputs.",
                 "Writing output/path.exr took 0.44 seconds",
@@ -579,7 +664,6 @@ class TestNukeAdaptor_on_cleanup:
             (0.0, 10.0),
         ),
         (
-            (1, 2),
             (
                 "NukeClient: Creating outputs 4-8 of 10 total outputs.",
                 "Writing output/path.exr took 0.99 seconds",
@@ -588,30 +672,25 @@ class TestNukeAdaptor_on_cleanup:
         ),
     ]
 
-    @pytest.mark.parametrize("regex_index, stdout, expected_progress", handle_progress_params)
+    @pytest.mark.parametrize("stdout, expected_progress", handle_progress_params)
     @patch("deadline.nuke_adaptor.NukeAdaptor.adaptor.NukeAdaptor.update_status")
-    @patch.object(NukeAdaptor, "_is_rendering", new_callable=PropertyMock(return_value=True))
     def test_handle_progress(
         self,
-        mock_is_rendering: Mock,
         mock_update_status: Mock,
-        regex_index: tuple[int, int],
         stdout: tuple[str, str],
         expected_progress: tuple[float, float],
         init_data: dict,
     ) -> None:
         # GIVEN
         adaptor = NukeAdaptor(init_data)
-        regex_callbacks = adaptor.regex_callbacks
-        progress_index, output_complete_index = regex_index
-        progress_regex = regex_callbacks[progress_index].regex_list[0]
-        output_complete_regex = regex_callbacks[output_complete_index].regex_list[0]
+        adaptor._is_rendering = True
+        regex_callback = adaptor.regex_callbacks[0]
 
         # WHEN
-        if progress_match := progress_regex.search(stdout[0]):
-            adaptor._handle_progress(progress_match)
-        if output_complete_match := output_complete_regex.search(stdout[1]):
-            adaptor._handle_output_complete(output_complete_match)
+        if progress_match := regex_callback.get_match(stdout[0]):
+            regex_callback.callback(progress_match)
+        if output_complete_match := regex_callback.get_match(stdout[1]):
+            regex_callback.callback(output_complete_match)
 
         # THEN
         assert progress_match is not None
@@ -620,70 +699,106 @@ class TestNukeAdaptor_on_cleanup:
             [call(progress=progress) for progress in expected_progress]
         )
 
-    handle_error_params = [
-        ("ERROR: Something terrible happened", 0),
-        ("Error: Something terrible happened", 1),
-        ("Error : Something terrible happened", 2),
-        ("Eddy[ERROR] - Something terrible happened", 3),
-    ]
-
-    @pytest.mark.parametrize("regex_index, stdout, expected_progress", handle_progress_params)
+    @pytest.mark.parametrize("stdout, expected_progress", handle_progress_params)
     @patch("deadline.nuke_adaptor.NukeAdaptor.adaptor.NukeAdaptor.update_status")
-    @patch.object(NukeAdaptor, "_is_rendering", new_callable=PropertyMock(return_value=False))
     def test_handle_progress_not_rendering(
         self,
-        mock_is_rendering: Mock,
         mock_update_status: Mock,
-        regex_index: tuple[int, int],
         stdout: tuple[str, str],
         expected_progress: tuple[float, float],
         init_data: dict,
     ) -> None:
         # GIVEN
         adaptor = NukeAdaptor(init_data)
-
-        regex_callbacks = adaptor.regex_callbacks
-        progress_index, output_complete_index = regex_index
-        output_complete_regex = regex_callbacks[output_complete_index].regex_list[0]
+        regex_callback = adaptor.regex_callbacks[0]
 
         # WHEN
-        if output_complete_match := output_complete_regex.search(stdout[1]):
-            adaptor._handle_output_complete(output_complete_match)
+        if output_complete_match := regex_callback.get_match(stdout[1]):
+            regex_callback.callback(output_complete_match)
 
         # THEN
         assert output_complete_match is not None
         mock_update_status.assert_not_called()
 
+    @patch("deadline.nuke_adaptor.NukeAdaptor.adaptor.NukeAdaptor.update_status")
+    def test_handle_output_complete_unchanged_progress(
+        self, mock_update_status: Mock, init_data: dict
+    ) -> None:
+        """Tests that progress is not reported again when an output does not change it"""
+        # GIVEN
+        adaptor = NukeAdaptor(init_data)
+        adaptor._is_rendering = True
+        regex_callback = adaptor.regex_callbacks[0]
+        stdout = [
+            "NukeClient: Creating outputs 1-2 of 2 total outputs.",
+            "Writing output/path.0001.exr took 0.44 seconds",
+            "Writing output/path.0002.exr took 0.44 seconds",
+        ]
+
+        # WHEN
+        for line in stdout:
+            match = regex_callback.get_match(line)
+            assert match is not None
+            regex_callback.callback(match)
+
+        # THEN
+        assert mock_update_status.call_args_list == [call(progress=50.0), call(progress=100)]
+
+    @patch("deadline.nuke_adaptor.NukeAdaptor.adaptor.time.monotonic", return_value=10.0)
+    @patch("deadline.nuke_adaptor.NukeAdaptor.adaptor.NukeAdaptor.update_status")
+    def test_handle_output_complete_coalesces_updates(
+        self, mock_update_status: Mock, mock_monotonic: Mock, init_data: dict
+    ) -> None:
+        """Tests that rapid progress within the same percent is only reported once"""
+        # GIVEN
+        adaptor = NukeAdaptor(init_data)
+        adaptor._is_rendering = True
+        regex_callback = adaptor.regex_callbacks[0]
+        stdout = ["NukeClient: Creating outputs 1-1000 of 1000 total outputs."] + [
+            "Writing output/path.exr took 0.01 seconds"
+        ] * 5
+
+        # WHEN
+        for line in stdout:
+            match = regex_callback.get_match(line)
+            assert match is not None
+            regex_callback.callback(match)
+        mock_monotonic.return_value += 1
+        last_match = regex_callback.get_match(stdout[-1])
+        assert last_match is not None
+        regex_callback.callback(last_match)
+
+        # THEN
+        assert mock_update_status.call_args_list == [
+            call(progress=pytest.approx(0.1)),
+            call(progress=pytest.approx(0.7)),
+        ]
+
     handle_error_params = [
-        ("ERROR: Something terrible happened", 0),
-        ("Error: Something terrible happened", 1),
-        ("Error : Something terrible happened", 2),
-        ("Eddy[ERROR] - Something terrible happened", 3),
+        "ERROR: Something terrible happened",
+        "Error: Something terrible happened",
+        "Error : Something terrible happened",
+        "Eddy[ERROR] - Something terrible happened",
     ]
 
     @pytest.mark.parametrize("continue_on_error", [True, False])
-    @pytest.mark.parametrize("stdout, regex_index", handle_error_params)
+    @pytest.mark.parametrize("stdout", handle_error_params)
     @patch("deadline.nuke_adaptor.NukeAdaptor.adaptor.NukeAdaptor.update_status")
-    @patch.object(NukeAdaptor, "_is_rendering", new_callable=PropertyMock(return_value=True))
     def test_handle_error(
         self,
-        mock_is_rendering: Mock,
         mock_update_status: Mock,
         stdout: str,
-        regex_index: int,
         continue_on_error: bool,
         init_data: dict,
     ) -> None:
         # GIVEN
-        ERROR_CALLBACK_INDEX = 3
         init_data["continue_on_error"] = continue_on_error
         adaptor = NukeAdaptor(init_data)
-        regex_callbacks = adaptor.regex_callbacks
-        error_regex = regex_callbacks[ERROR_CALLBACK_INDEX].regex_list[regex_index]
+        regex_callback = adaptor.regex_callbacks[1]
 
-        if match := error_regex.search(stdout):
+        if match := regex_callback.get_match(stdout):
             # WHEN
-            adaptor._handle_error(match)
+            regex_callback.callback(match)
 
         # THEN
         assert match
@@ -698,24 +813,77 @@ class TestNukeAdaptor_on_cleanup:
         [
             ("NukeClient: Nuke Version 14.0v2", "14.0v2"),
             ("NukeClient: Nuke Version 15.0", "15.0"),
+            ("NukeClient: Nuke Version 15.1v3 (64-bit)", "15.1v3"),
+            ("NukeClient: Nuke Version ", ""),
         ],
     )
     def test_handle_version(self, init_data: dict, version_string: str, expected_version: str):
         """Tests that the _handle_version method returns the version correctly"""
         # GIVEN
-        VERSION_CALLBACK_INDEX = 4
         adaptor = NukeAdaptor(init_data)
-        regex_callbacks = adaptor.regex_callbacks
-        complete_regex = regex_callbacks[VERSION_CALLBACK_INDEX].regex_list[0]
+        regex_callback = adaptor.regex_callbacks[0]
 
         # WHEN
-        match = complete_regex.search(version_string)
+        match = regex_callback.get_match(version_string)
         assert match is not None
-        adaptor._handle_version(match)
+        regex_callback.callback(match)
 
         # THEN
         assert adaptor._nuke_version == expected_version
 
+    @pytest.mark.parametrize(
+        "stdout, expected_handler",
+        [
+            ("NukeClient: Finished Rendering Frames 1-10", "_handle_complete"),
+            ("INFO: Writing output/path.exr took 0.44 seconds", "_handle_output_complete"),
+            ("NukeClient: Nuke Version 15.0", "_handle_version"),
+        ],
+    )
+    def test_handle_stdout_dispatch(
+        self, init_data: dict, stdout: str, expected_handler: str
+    ) -> None:
+        """Tests that a line is passed to the handler of the pattern that matches first in it"""
+        # GIVEN
+        adaptor = NukeAdaptor(init_data)
+        regex_callback = adaptor.regex_callbacks[0]
+
+        with patch.object(adaptor, expected_handler) as mock_handler:
+            # WHEN
+            match = regex_callback.get_match(stdout)
+            assert match is not None
+            regex_callback.callback(match)
+
+        # THEN
+        mock_handler.assert_called_once()
+        handler_match = mock_handler.call_args.args[0]
+        assert handler_match.re is adaptor_module._STDOUT_HANDLERS[expected_handler]
+
+    @pytest.mark.parametrize(
+        "stdout",
+        [
+            "Writing /tmp/a.exr took 1.0 seconds ERROR: disk full",
+            "NukeClient: Finished Rendering Frame 3 Error: something",
+            "Eddy[ERROR] - NukeClient: Nuke Version 15.0",
+        ],
+    )
+    @patch("deadline.nuke_adaptor.NukeAdaptor.adaptor.NukeAdaptor.update_status")
+    def test_handle_error_after_status_message(
+        self, mock_update_status: Mock, init_data: dict, stdout: str
+    ) -> None:
+        """Tests that an error is detected even when the line also matches a status pattern"""
+        # GIVEN
+        init_data["continue_on_error"] = False
+        adaptor = NukeAdaptor(init_data)
+        adaptor._is_rendering = True
+        regexhandler = RegexHandler(adaptor.regex_callbacks)
+
+        # WHEN
+        regexhandler.emit(logging.LogRecord("test", logging.INFO, "", 0, stdout, None, None))
+
+        # THEN
+        assert isinstance(adaptor._exc_info, RuntimeError)
+        assert str(adaptor._exc_info) == f"Nuke Encountered an Error: {stdout}"
+
     @pytest.mark.parametrize("adaptor_exc_info", [RuntimeError("Something Bad Happened!"), None])
     def test_has_exception(self, init_data: dict, adaptor_exc_info: Exception | None) -> None:
         """
@@ -782,3 +950,34 @@ class TestNukeAdaptor_on_cancel:
         # THEN
         assert "CANCEL REQUESTED" in caplog.text
         assert "Nothing to cancel because Nuke is not running" in caplog.text
+
+
+class TestNotifyingActionsQueue:
+    """Tests for _NotifyingActionsQueue"""
+
+    def test_notifies_when_last_action_dequeued(self) -> None:
+        # GIVEN
+        cond = MagicMock()
+        queue = _NotifyingActionsQueue(cond)
+        queue.enqueue_action(Action("first"))
+        queue.enqueue_action(Action("second"))
+
+        # WHEN
+        queue.dequeue_action()
+        cond.notify_all.assert_not_called()
+        queue.dequeue_action()
+
+        # THEN
+        cond.notify_all.assert_called_once_with()
+
+    def test_does_not_notify_when_polling_empty_queue(self) -> None:
+        # GIVEN
+        cond = MagicMock()
+        queue = _NotifyingActionsQueue(cond)
+
+        # WHEN
+        action = queue.dequeue_action()
+
+        # THEN
+        assert action is None
+        cond.notify_all.assert_not_called()
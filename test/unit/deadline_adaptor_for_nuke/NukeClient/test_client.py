@@ -120,26 +120,23 @@ class TestNukeClient:
         mock_script_close.assert_called_once_with()
         mock_script_exit.assert_called_once_with()
 
-    @pytest.mark.parametrize("is_dir", [True, False])
     @patch.object(nuke_client_mod, "os")
-    def test_ensure_output_dir(self, mock_os: Mock, is_dir: bool):
+    def test_ensure_output_dir(self, mock_os: Mock):
         """
-        Test that the ensure_output_dir handle which is run before each render works properly
+        Test that the ensure_output_dir handle which is run before each render works properly and
+        only touches the filesystem the first time it sees an output directory
         """
         # GIVEN
         NukeClient(server_path="/tmp/9999")
-        mock_os.path.isdir.return_value = is_dir
+        mock_os.path.dirname.return_value = "/some/output/dir"
         ensure_output_dir = nuke.addBeforeRender.call_args[0][0]
 
         # WHEN
         ensure_output_dir()
+        ensure_output_dir()
 
         # THEN
-        mock_os.path.isdir.assert_called_once_with(mock_os.path.dirname.return_value)
-        if is_dir:
-            mock_os.makedirs.assert_not_called()
-        else:
-            mock_os.makedirs.assert_called_once_with(mock_os.path.dirname.return_value)
+        mock_os.makedirs.assert_called_once_with("/some/output/dir", exist_ok=True)
 
     @pytest.mark.skipif(os.name == "nt", reason="POSIX path mapping not implemented on Windows")
     @pytest.mark.parametrize(
@@ -241,8 +238,22 @@ class TestNukeClient:
                     ),
                 ],
             ),
+            (
+                "/session-dir-other/thing",
+                "/session-dir/session-dir-other/thing",
+                "/session-dir/session-dir-other/thing",
+                PurePosixPath,
+                [
+                    PathMappingRule(
+                        source_path_format="posix",
+                        source_path="/",
+                        destination_os="linux",
+                        destination_path="/session-dir",
+                    ),
+                ],
+            ),
         ],
-        ids=["mapping from root", "multi-rule"],
+        ids=["mapping from root", "multi-rule", "sibling of destination"],
     )
     @patch.object(nuke, "addFilenameFilter")
     @patch.object(nuke_client_mod, "Path")
@@ -273,6 +284,57 @@ class TestNukeClient:
         mock_addfilenamefilter.assert_called_once_with(client.map_path)
         assert mapped == expected_mapped
 
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX path mapping not implemented on Windows")
+    @patch.object(nuke, "addFilenameFilter")
+    @patch.object(ClientInterface, "map_path")
+    @patch.object(ClientInterface, "path_mapping_rules")
+    def test_map_path_cache(
+        self,
+        mock_path_mapping_rules: Mock,
+        mock_map_path: Mock,
+        mock_addfilenamefilter: Mock,
+    ):
+        """Tests that each path is only mapped once and the rules are only requested once"""
+        # GIVEN
+        client = NukeClient(server_path="/tmp/9999")
+        mock_map_path.side_effect = lambda path: f"/mapped/{path}"
+        mock_path_mapping_rules.return_value = [
+            PathMappingRule(
+                source_path_format="posix",
+                source_path="/some",
+                destination_os="linux",
+                destination_path="/mapped",
+            ),
+        ]
+
+        # WHEN
+        mapped = [client.map_path(path) for path in ("a/path", "a/path", "another/path")]
+
+        # THEN
+        assert mapped == ["/mapped/a/path", "/mapped/a/path", "/mapped/another/path"]
+        assert mock_map_path.call_count == 2
+        mock_path_mapping_rules.assert_called_once()
+
+    @patch.object(nuke, "addFilenameFilter")
+    @patch.object(ClientInterface, "map_path")
+    @patch.object(ClientInterface, "path_mapping_rules", return_value=[])
+    def test_map_path_no_rules(
+        self,
+        mock_path_mapping_rules: Mock,
+        mock_map_path: Mock,
+        mock_addfilenamefilter: Mock,
+    ):
+        """Tests that the adaptor is not asked to map paths when there are no rules"""
+        # GIVEN
+        client = NukeClient(server_path="/tmp/9999")
+
+        # WHEN
+        mapped = client.map_path("/some/path")
+
+        # THEN
+        assert mapped == "/some/path"
+        mock_map_path.assert_not_called()
+
     @pytest.mark.skipif(os.name == "nt", reason="POSIX path mapping not implemented on Windows")
     @patch.dict(os.environ, {"NUKE_TEMP_DIR": "/var/tmp/nuke_temp_dir"})
     @patch(
@@ -314,6 +314,19 @@ class TestNukeHandler:
         assert str(exc_info.value) == "NukeClient: start_render called without a frameRange."
         nuke_execute.assert_not_called()
 
+    @pytest.mark.parametrize("frame_range", ["first-last", "10-", "5abc", "7 8", "1-5x"])
+    @patch.object(nuke, "execute")
+    def test_start_render_invalid_frame_range(
+        self, nuke_execute: MagicMock, nukehandler: NukeHandler, frame_range: str
+    ):
+        # WHEN
+        with pytest.raises(Exception) as exc_info:
+            nukehandler.start_render({"frameRange": frame_range})
+
+        # THEN
+        assert str(exc_info.value).startswith(f"Invalid frame range {frame_range}.")
+        nuke_execute.assert_not_called()
+
     def test_set_write_nodes(self, write_nodes: List[MockNode], nukehandler: NukeHandler):
         # GIVEN
         data = {"write_nodes": [node.name() for node in write_nodes]}
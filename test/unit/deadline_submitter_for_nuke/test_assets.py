@@ -13,6 +13,7 @@ from deadline.nuke_submitter.assets import (
     find_all_write_nodes,
     get_node_file_knob_paths,
     get_node_filenames,
+    get_node_output_directories,
     get_scene_asset_references,
 )
 
@@ -31,7 +32,9 @@ def _activated_reading_write_node_knobs(knob_name: str):
 
 
 @patch("os.path.isfile", return_value=True)
+@patch("deadline.nuke_submitter.assets.get_project_path", return_value="/this")
 @patch("deadline.nuke_submitter.assets.get_nuke_script_file", return_value="/this/scriptfile.nk")
+@patch("deadline.nuke_submitter.assets.get_node_output_directories", return_value={"/one", "/two"})
 @patch(
     "deadline.nuke_submitter.assets.get_node_filenames",
     return_value=["/one/asset.png", "/two/asset.png"],
@@ -54,7 +57,9 @@ def test_get_scene_asset_references(
     mock_is_stock_config_enabled: Mock,
     mock_is_custom_config_enabled: Mock,
     mock_get_node_filenames: Mock,
+    mock_get_node_output_directories: Mock,
     mock_get_nuke_script_file: Mock,
+    mock_get_project_path: Mock,
     mock_path_isfile: Mock,
 ):
     # GIVEN
@@ -92,6 +97,7 @@ def test_get_scene_asset_references(
     # THEN
     assert expected_script_file in results.input_filenames
     assert all(asset in results.input_filenames for asset in expected_assets)
+    assert results.output_directories == {"/one", "/two"}
 
     # GIVEN
     expected_ocio_config_path = mock_get_custom_config_path.return_value
@@ -113,6 +119,82 @@ def test_get_scene_asset_references(
     )
 
 
+@patch("os.path.isdir", return_value=False)
+@patch("os.path.isfile", return_value=True)
+@patch("deadline.nuke_submitter.assets.get_project_path", return_value="/this")
+@patch("deadline.nuke_submitter.assets.get_nuke_script_file", return_value="/this/scriptfile.nk")
+@patch(
+    "deadline.nuke_submitter.assets.get_node_filenames",
+    return_value={"/one/asset.png", "/two/asset.png"},
+)
+@patch("deadline.nuke_util.ocio.is_OCIO_enabled", return_value=False)
+def test_get_scene_asset_references_checks_shared_files_once(
+    mock_is_OCIO_enabled: Mock,
+    mock_get_node_filenames: Mock,
+    mock_get_nuke_script_file: Mock,
+    mock_get_project_path: Mock,
+    mock_path_isfile: Mock,
+    mock_path_isdir: Mock,
+):
+    # GIVEN
+    read_nodes = [MagicMock(), MagicMock()]
+    for read_node in read_nodes:
+        read_node.Class.return_value = "Read"
+        read_node.knob("disable").value.return_value = False
+        read_node.knob("reading").value.return_value = False
+    nuke.allNodes.return_value = read_nodes
+
+    # WHEN
+    results = get_scene_asset_references()
+
+    # THEN
+    assert results.input_filenames == {"/this/scriptfile.nk", "/one/asset.png", "/two/asset.png"}
+    assert mock_path_isdir.call_count == 2
+
+
+@pytest.mark.skipif(os.name == "nt", reason="Uses POSIX install paths")
+@patch("os.path.isdir", return_value=False)
+@patch("os.path.isfile", return_value=True)
+@patch("deadline.nuke_submitter.assets.platform", new="linux")
+@patch.object(nuke, "EXE_PATH", new="/opt/Nuke15.0v2/Nuke15.0", create=True)
+@patch("deadline.nuke_submitter.assets.get_project_path", return_value="/this")
+@patch("deadline.nuke_submitter.assets.get_nuke_script_file", return_value="/this/scriptfile.nk")
+@patch(
+    "deadline.nuke_submitter.assets.get_node_filenames",
+    return_value={
+        "/opt/Nuke15.0v2/plugins/OCIOConfigs/configs/nuke-default/config.ocio",
+        "/opt/Nuke15.0v2-other/asset.png",
+        "/one/asset.png",
+    },
+)
+@patch("deadline.nuke_util.ocio.is_OCIO_enabled", return_value=False)
+def test_get_scene_asset_references_skips_install_dir(
+    mock_is_OCIO_enabled: Mock,
+    mock_get_node_filenames: Mock,
+    mock_get_nuke_script_file: Mock,
+    mock_get_project_path: Mock,
+    mock_path_isfile: Mock,
+    mock_path_isdir: Mock,
+):
+    # GIVEN
+    root_node = MagicMock()
+    root_node.Class.return_value = "Root"
+    root_node.knob("disable").value.return_value = False
+    root_node.knob("reading").value.return_value = False
+    nuke.allNodes.return_value = [root_node]
+
+    # WHEN
+    with patch.object(nuke, "root", return_value=root_node):
+        results = get_scene_asset_references()
+
+    # THEN
+    assert results.input_filenames == {
+        "/this/scriptfile.nk",
+        "/opt/Nuke15.0v2-other/asset.png",
+        "/one/asset.png",
+    }
+
+
 @patch("os.path.isfile", return_value=False)
 @patch("deadline.nuke_submitter.assets.get_nuke_script_file", return_value="/this/scriptfile.nk")
 def test_get_scene_asset_references_script_not_saved(
@@ -203,6 +285,15 @@ def test_find_all_write_nodes():
                 "/path/to/file.0100.formatting",
             },
         ),
+        (
+            "/path/to/####/file.%04d.mixed",
+            {
+                "/path/to/0000/file.0000.mixed",
+                "/path/to/0001/file.0001.mixed",
+                "/path/to/0002/file.0002.mixed",
+                "/path/to/0100/file.0100.mixed",
+            },
+        ),
         (
             r"/path/to/file.%d.formatting",
             {
@@ -218,7 +309,9 @@ def test_find_all_write_nodes():
 def test_get_node_filenames(mock_get_node_file_knob_paths: Mock, asset_path, formatted_paths):
     # GIVEN
     node_filepaths = [asset_path]
-    mock_get_node_file_knob_paths.side_effect = lambda node: (path for path in node_filepaths)
+    mock_get_node_file_knob_paths.side_effect = lambda node, project_path: (
+        path for path in node_filepaths
+    )
     node = MagicMock()
     node.frameRange.return_value = [0, 1, 2, 100]
 
@@ -229,6 +322,24 @@ def test_get_node_filenames(mock_get_node_file_knob_paths: Mock, asset_path, for
     assert results == formatted_paths
 
 
+@patch("deadline.nuke_submitter.assets.get_node_file_knob_paths")
+def test_get_node_output_directories(mock_get_node_file_knob_paths: Mock):
+    # GIVEN
+    mock_get_node_file_knob_paths.return_value = [
+        "/renders/file.####.exr",
+        "/renders/shot_%03d/file.%03d.exr",
+    ]
+    node = MagicMock()
+    node.frameRange.return_value = [1, 2]
+
+    # WHEN
+    results = get_node_output_directories(node)
+
+    # THEN
+    assert results == {"/renders", "/renders/shot_001", "/renders/shot_002"}
+    node.frameRange.assert_called_once()
+
+
 @patch("deadline.nuke_submitter.assets.get_project_path")
 def test_get_node_file_knob_paths(mock_project_path: Mock):
     # GIVEN
@@ -269,3 +380,21 @@ def test_get_node_file_knob_paths(mock_project_path: Mock):
         mock_project_path(), mock_tcl_file_knob.getEvaluatedValue()
     )
     assert next(results) == os.path.join(mock_project_path(), mock_file_knob.value())
+
+
+@patch("deadline.nuke_submitter.assets.get_project_path")
+def test_get_node_file_knob_paths_given_project_path(mock_project_path: Mock):
+    # GIVEN
+    project_path = os.path.join("given", "project")
+    mock_file_knob = MagicMock()
+    mock_file_knob.Class.return_value = "File_Knob"
+    mock_file_knob.value.return_value = os.path.join("this", "is", "a", "path")
+    mock_node = MagicMock()
+    mock_node.allKnobs.return_value = [mock_file_knob]
+
+    # WHEN
+    results = list(get_node_file_knob_paths(mock_node, project_path))
+
+    # THEN
+    assert results == [os.path.join(project_path, mock_file_knob.value())]
+    mock_project_path.assert_not_called()
@@ -168,6 +168,31 @@ def test_get_config_absolute_search_paths(ocio_config: MockOCIOConfig) -> None:
     assert expected == actual
 
 
+@patch("os.path.getmtime")
+@patch("PyOpenColorIO.Config.CreateFromFile")
+def test_get_config_absolute_search_paths_from_file(
+    create_from_file: MagicMock, getmtime: MagicMock, ocio_config: MockOCIOConfig
+) -> None:
+    # GIVEN
+    ocio_config_path = "/this/ocio_configs/cached_config.ocio"
+    create_from_file.return_value = ocio_config
+    getmtime.return_value = 1.0
+    expected = [
+        os.path.join(ocio_config.getWorkingDir(), search_path)
+        for search_path in ocio_config.getSearchPaths()
+    ]
+
+    # WHEN
+    first = nuke_ocio.get_config_absolute_search_paths(ocio_config_path)
+    second = nuke_ocio.get_config_absolute_search_paths(ocio_config_path)
+    getmtime.return_value = 2.0
+    after_modification = nuke_ocio.get_config_absolute_search_paths(ocio_config_path)
+
+    # THEN
+    assert first == second == after_modification == expected
+    assert create_from_file.call_count == 2
+
+
 def test_update_config_search_paths(ocio_config: MockOCIOConfig) -> None:
     # GIVEN
     search_paths = ["relative/path/to/luts", "/absolute/path/to/luts"]